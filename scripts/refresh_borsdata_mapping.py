@@ -54,7 +54,7 @@ def main():
     all_tickers = {ticker: market for ticker, market in mapping._mapping.items()}
 
     # Get samples
-    nordic_samples = [t for t, m in all_tickers.items() if m == "Nordic"][:5]
+    nordic_samples = [t for t, m in all_tickers.items() if m == "nordic"][:5]
     global_samples = [t for t, m in all_tickers.items() if m == "global"][:5]
 
     if nordic_samples:
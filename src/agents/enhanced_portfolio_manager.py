@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, List, Optional
@@ -64,13 +65,17 @@ class EnhancedPortfolioManager:
         self.universe = universe
         self.analyst_names = analysts
         self.model_config = model_config
-        self.ticker_markets = ticker_markets or {}
+        # Canonical lowercase market labels ("nordic"/"global") so routing compares exact strings
+        self.ticker_markets = {ticker: market.lower() for ticker, market in (ticker_markets or {}).items()}
         self.home_currency = home_currency.upper()
         self.no_cache = no_cache
         self.no_cache_agents = no_cache_agents
         self.verbose = verbose
         self.session_id = session_id
         self.max_workers = max_workers
+        # One long-lived pool for all analyst fan-out so worker threads (and their HTTP clients) stay warm;
+        # created on first use so price-context/trade-only managers never own threads
+        self._executor: Optional[ThreadPoolExecutor] = None
         self.analysts = self._initialize_analysts(analysts, model_config)
         self.exchange_rates: Dict[str, float] = {}  # Currency -> rate (e.g., {"USD": 10.5, "GBP": 13.2})
         self.analysis_cache = get_analysis_cache()
@@ -83,6 +88,24 @@ class EnhancedPortfolioManager:
         self.governor_profile = governor_profile
         self.governor = PortfolioGovernor(profile=governor_profile) if use_governor else None
 
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the analyst worker pool, creating it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="analyst")
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the analyst worker pool if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self) -> "EnhancedPortfolioManager":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def _initialize_analysts(self, analyst_names: List[str], model_config: Dict[str, Any]) -> List[Any]:
         """
         Initialize all requested analysts from the analyst registry
@@ -358,7 +381,7 @@ class EnhancedPortfolioManager:
 
         # STEP 4: Call function-based analysts with AgentState for each ticker
         from src.graph.state import AgentState
-        from concurrent.futures import ThreadPoolExecutor, as_completed
+        from concurrent.futures import as_completed
 
         configured_model_name = self.model_config.get("name")
         configured_model_provider = self.model_config.get("provider")
@@ -671,53 +694,51 @@ class EnhancedPortfolioManager:
                 return None
 
         if uncached_combos:
-            max_workers = min(len(uncached_combos), self.max_workers)
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                future_to_combo = {}
-                for analyst_info, ticker_idx, ticker in uncached_combos:
-                    ticker_data = prefetched_data.get(ticker, {})
-
-                    # Get position's acquisition date if this ticker is in the portfolio
-                    position_date_acquired = position_dates.get(ticker)
-
-                    # Create AgentState with prefetched data (same pattern as main.py)
-                    state: AgentState = {
-                        "messages": [],
-                        "data": {
-                            "tickers": [ticker],
-                            "ticker": ticker,
-                            "start_date": start_date,
-                            "end_date": end_date,
-                            "position_date_acquired": position_date_acquired,
-                            "api_key": api_key,
-                            "model_config": self.model_config,
-                            "prefetched_financial_data": {
-                                ticker: ticker_data
-                            },
-                            "analyst_signals": {},
+            future_to_combo = {}
+            for analyst_info, ticker_idx, ticker in uncached_combos:
+                ticker_data = prefetched_data.get(ticker, {})
+
+                # Get position's acquisition date if this ticker is in the portfolio
+                position_date_acquired = position_dates.get(ticker)
+
+                # Create AgentState with prefetched data (same pattern as main.py)
+                state: AgentState = {
+                    "messages": [],
+                    "data": {
+                        "tickers": [ticker],
+                        "ticker": ticker,
+                        "start_date": start_date,
+                        "end_date": end_date,
+                        "position_date_acquired": position_date_acquired,
+                        "api_key": api_key,
+                        "model_config": self.model_config,
+                        "prefetched_financial_data": {
+                            ticker: ticker_data
                         },
-                        "metadata": {
-                            "portfolio_manager_mode": True,
-                            "show_reasoning": False,
-                        }
+                        "analyst_signals": {},
+                    },
+                    "metadata": {
+                        "portfolio_manager_mode": True,
+                        "show_reasoning": False,
                     }
+                }
 
-                    future = executor.submit(run_analyst, analyst_info, state, ticker, ticker_idx)
-                    future_to_combo[future] = (analyst_info, ticker)
+                future = self._get_executor().submit(run_analyst, analyst_info, state, ticker, ticker_idx)
+                future_to_combo[future] = (analyst_info, ticker)
 
-                for future in as_completed(future_to_combo):
-                    try:
-                        result = future.result(timeout=120)
-                        if result:
-                            signals.append(result)
-                    except TimeoutError:
-                        analyst_info, ticker = future_to_combo[future]
-                        if self.verbose:
-                            print(f'\n  Warning: {analyst_info["display_name"]} for {ticker} timed out after 120 seconds')
-                    except Exception as exc:
-                        analyst_info, ticker = future_to_combo[future]
-                        if self.verbose:
-                            print(f'\n  Warning: {analyst_info["display_name"]} for {ticker} generated an exception: {exc}')
+            for future in as_completed(future_to_combo):
+                try:
+                    result = future.result(timeout=120)
+                    if result:
+                        signals.append(result)
+                except TimeoutError:
+                    analyst_info, ticker = future_to_combo[future]
+                    if self.verbose:
+                        print(f'\n  Warning: {analyst_info["display_name"]} for {ticker} timed out after 120 seconds')
+                except Exception as exc:
+                    analyst_info, ticker = future_to_combo[future]
+                    if self.verbose:
+                        print(f'\n  Warning: {analyst_info["display_name"]} for {ticker} generated an exception: {exc}')
 
         # Stop progress display and show summary
         progress.stop()
@@ -869,11 +890,11 @@ class EnhancedPortfolioManager:
         if not api_key:
             # Fallback to market-based guess
             market = self.ticker_markets.get(ticker, "global")
-            return "SEK" if market == "Nordic" else "USD"
+            return "SEK" if market == "nordic" else "USD"
 
         try:
             market = self.ticker_markets.get(ticker, "global")
-            use_global = market.lower() == "global"
+            use_global = market == "global"
             instrument = _borsdata_client.get_instrument(ticker, api_key=api_key, use_global=use_global)
             currency = instrument.get("stockPriceCurrency")
             if currency:
@@ -884,7 +905,7 @@ class EnhancedPortfolioManager:
 
         # Fallback
         market = self.ticker_markets.get(ticker, "global")
-        return "SEK" if market == "Nordic" else "USD"
+        return "SEK" if market == "nordic" else "USD"
 
     def _fetch_latest_close(self, ticker: str) -> tuple[float, str]:
         """
@@ -903,7 +924,7 @@ class EnhancedPortfolioManager:
 
         try:
             market = self.ticker_markets.get(ticker, "global")
-            use_global = market.lower() == "global"
+            use_global = market == "global"
 
             instrument = _borsdata_client.get_instrument(ticker, api_key=api_key, use_global=use_global)
             raw_currency = instrument.get("stockPriceCurrency", "USD")
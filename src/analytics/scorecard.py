@@ -109,7 +109,7 @@ def build_price_index(
     markets: dict[str, str] = {}
     for t in tickers:
         market = get_ticker_market(t)
-        markets[t] = (market or "global").lower()
+        markets[t] = market or "global"
     set_ticker_markets(markets)
 
     index: dict[str, list[tuple[str, float]]] = {}
@@ -67,8 +67,7 @@ def main() -> int:
         # Look up the ticker in the global mapping
         market = get_ticker_market(ticker)
         if market:
-            # Convert "Nordic" to "nordic" for consistency with existing code
-            ticker_markets[ticker] = market.lower()
+            ticker_markets[ticker] = market
         else:
             # Unknown ticker - we'll add it to global as fallback and warn
             ticker_markets[ticker] = "global"
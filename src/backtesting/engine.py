@@ -55,6 +55,7 @@ class BacktestEngine:
         initial_margin_requirement: float,
         use_governor: bool = False,
         governor_profile: str = "preservation",
+        calendar: pd.DatetimeIndex | None = None,
     ) -> None:
         self._agent = agent
         self._tickers = tickers
@@ -66,9 +67,11 @@ class BacktestEngine:
         self._model_provider = model_provider
         self._selected_analysts = selected_analysts
         self._start_date_obj = datetime.strptime(self._start_date, "%Y-%m-%d").date()
+        # Business days to simulate; callers running many backtests over one window can pass it prebuilt
+        self._calendar = calendar
         self._benchmark_ticker = "OMXS30"  # Default benchmark
         self._ticker_markets = {
-            ticker: (get_ticker_market(ticker) or "global").lower()
+            ticker: get_ticker_market(ticker) or "global"
             for ticker in tickers
         }
 
@@ -201,7 +204,7 @@ class BacktestEngine:
     def run_backtest(self) -> PerformanceMetrics:
         self._prefetch_data()
 
-        dates = pd.date_range(self._start_date, self._end_date, freq="B")
+        dates = self._calendar if self._calendar is not None else pd.date_range(self._start_date, self._end_date, freq="B")
         if len(dates) > 0:
             self._portfolio_values = [
                 {"Date": dates[0], "Portfolio Value": self._initial_capital}
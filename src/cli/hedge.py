@@ -496,7 +496,7 @@ def _build_ticker_markets(tickers: List[str]) -> dict[str, str]:
     for ticker in tickers:
         market = get_ticker_market(ticker)
         if market:
-            markets[ticker] = market.lower()
+            markets[ticker] = market
         else:
             markets[ticker] = "global"
             unknown.append(ticker)
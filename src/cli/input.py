@@ -215,7 +215,7 @@ class CLIInputs:
     initial_cash: float
     margin_requirement: float
     use_global: bool = False
-    ticker_markets: dict[str, str] = None  # Map ticker -> "Nordic" or "Global"
+    ticker_markets: dict[str, str] = None  # Map ticker -> "nordic" or "global"
     show_reasoning: bool = False
     show_agent_graph: bool = False
     verbose: bool = False
@@ -280,7 +280,7 @@ def parse_cli_inputs(
 
     # First, handle explicitly specified Nordic tickers (backward compatibility)
     for ticker in explicit_nordic_tickers:
-        ticker_markets[ticker] = "Nordic"
+        ticker_markets[ticker] = "nordic"
 
     # For --tickers, automatically detect market using the mapping
     for ticker in raw_tickers:
@@ -28,9 +28,13 @@ def _get_cache_path() -> Path:
 # Cache TTL (24 hours)
 CACHE_TTL_SECONDS = 24 * 60 * 60
 
+# Canonical market labels returned by get_market()/get_ticker_market()
+NORDIC = "nordic"
+GLOBAL = "global"
+
 
 class TickerMapping:
-    """Manages the mapping of ticker symbols to their markets (Nordic/Global)."""
+    """Manages the mapping of ticker symbols to their markets (nordic/global)."""
 
     def __init__(self, client: Optional[BorsdataClient] = None):
         """Initialize the ticker mapping.
@@ -39,7 +43,7 @@ class TickerMapping:
             client: Optional BorsdataClient instance. If not provided, a new one is created.
         """
         self.client = client or BorsdataClient()
-        self._mapping: Dict[str, str] = {}  # ticker -> "Nordic" or "global"
+        self._mapping: Dict[str, str] = {}  # ticker -> NORDIC or GLOBAL
         self._loaded = False
 
     def _load_from_cache(self) -> bool:
@@ -62,8 +66,8 @@ class TickerMapping:
             if age > CACHE_TTL_SECONDS:
                 return False
 
-            # Load the mapping
-            self._mapping = data.get("mapping", {})
+            # Load the mapping (older cache files stored "Nordic"; normalize to canonical labels)
+            self._mapping = {ticker: market.lower() for ticker, market in data.get("mapping", {}).items()}
             self._loaded = True
             return True
 
@@ -78,8 +82,8 @@ class TickerMapping:
             "mapping": self._mapping,
             "stats": {
                 "total": len(self._mapping),
-                "nordic": sum(1 for v in self._mapping.values() if v == "Nordic"),
-                "global": sum(1 for v in self._mapping.values() if v == "global"),
+                "nordic": sum(1 for v in self._mapping.values() if v == NORDIC),
+                "global": sum(1 for v in self._mapping.values() if v == GLOBAL),
             },
         }
 
@@ -125,19 +129,19 @@ class TickerMapping:
 
             # Determine market based on instrument ID
             if inst.get("insId") in nordic_ids:
-                self._mapping[ticker_upper] = "Nordic"
+                self._mapping[ticker_upper] = NORDIC
                 nordic_count += 1
             else:
-                self._mapping[ticker_upper] = "global"
+                self._mapping[ticker_upper] = GLOBAL
                 global_count += 1
 
             # Also map the yahoo ticker if available
             yahoo = inst.get("yahoo")
             if yahoo and yahoo.upper() not in self._mapping:
                 if inst.get("insId") in nordic_ids:
-                    self._mapping[yahoo.upper()] = "Nordic"
+                    self._mapping[yahoo.upper()] = NORDIC
                 else:
-                    self._mapping[yahoo.upper()] = "global"
+                    self._mapping[yahoo.upper()] = GLOBAL
 
         self._loaded = True
         self._save_to_cache()
@@ -170,7 +174,7 @@ class TickerMapping:
             ticker: The ticker symbol to look up.
 
         Returns:
-            "Nordic" or "global" if the ticker is found, None otherwise.
+            "nordic" or "global" if the ticker is found, None otherwise.
         """
         if not self._loaded:
             self.ensure_loaded()
@@ -193,8 +197,8 @@ class TickerMapping:
 
         return {
             "total": len(self._mapping),
-            "nordic": sum(1 for v in self._mapping.values() if v == "Nordic"),
-            "global": sum(1 for v in self._mapping.values() if v == "global"),
+            "nordic": sum(1 for v in self._mapping.values() if v == NORDIC),
+            "global": sum(1 for v in self._mapping.values() if v == GLOBAL),
         }
 
 
@@ -225,7 +229,7 @@ def get_ticker_market(ticker: str, *, api_key: Optional[str] = None) -> Optional
         api_key: Optional API key to use if fetching from API.
 
     Returns:
-        "Nordic" or "global" if the ticker is found, None otherwise.
+        "nordic" or "global" if the ticker is found, None otherwise.
     """
     mapping = get_ticker_mapping()
     mapping.ensure_loaded(api_key=api_key)
@@ -251,4 +255,6 @@ __all__ = [
     "get_ticker_market",
     "refresh_ticker_mapping",
     "CACHE_TTL_SECONDS",
+    "GLOBAL",
+    "NORDIC",
 ]
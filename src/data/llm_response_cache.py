@@ -26,6 +26,11 @@ engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+def hash_prompt(prompt: str) -> str:
+    """Generate the SHA256 lookup hash stored alongside each cached prompt."""
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
 class LLMResponseCache:
     """Persistent cache for LLM responses with 7-day freshness policy."""
 
@@ -46,7 +51,7 @@ class LLMResponseCache:
 
     def _get_prompt_hash(self, prompt: str) -> str:
         """Generate SHA256 hash of prompt for efficient lookup."""
-        return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        return hash_prompt(prompt)
 
     def get_cached_response(
         self,
@@ -54,6 +59,7 @@ class LLMResponseCache:
         analyst_name: str,
         prompt: str,
         max_age_days: int = 7,
+        prompt_hash: Optional[str] = None,
     ) -> Optional[dict[str, Any]]:
         """
         Retrieve cached LLM response if it exists and is fresh.
@@ -63,13 +69,14 @@ class LLMResponseCache:
             analyst_name: Name of the analyst agent
             prompt: Full prompt text
             max_age_days: Maximum age in days to consider response fresh (default: 7)
+            prompt_hash: Optional precomputed hash_prompt(prompt) to skip rehashing
 
         Returns:
             Cached response as dict if found and fresh, None otherwise
         """
         from app.backend.database.models import LLMResponseCache as CacheModel
 
-        prompt_hash = self._get_prompt_hash(prompt)
+        prompt_hash = prompt_hash or self._get_prompt_hash(prompt)
         cutoff_date = datetime.utcnow() - timedelta(days=max_age_days)
 
         db = self.SessionLocal()
@@ -104,6 +111,7 @@ class LLMResponseCache:
         response: BaseModel,
         model_name: Optional[str] = None,
         model_provider: Optional[str] = None,
+        prompt_hash: Optional[str] = None,
     ) -> None:
         """
         Store LLM response in cache.
@@ -115,10 +123,11 @@ class LLMResponseCache:
             response: Pydantic model instance to cache
             model_name: Optional LLM model name
             model_provider: Optional LLM provider name
+            prompt_hash: Optional precomputed hash_prompt(prompt) to skip rehashing
         """
         from app.backend.database.models import LLMResponseCache as CacheModel
 
-        prompt_hash = self._get_prompt_hash(prompt)
+        prompt_hash = prompt_hash or self._get_prompt_hash(prompt)
 
         # Serialize pydantic response to JSON
         response_json = json.dumps(response.model_dump())
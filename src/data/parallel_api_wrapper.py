@@ -51,7 +51,9 @@ from src.tools.api import (
     get_prices,
     get_financial_metrics,
     get_insider_trades,
+    get_insider_trades_bulk,
     get_company_events,
+    get_company_events_bulk,
     get_market_cap,
     set_ticker_markets,
     search_line_items,
@@ -90,6 +92,17 @@ async def _timed_run_in_thread_pool(func, data_type, *args, max_workers: int = N
     return result
 
 
+async def _fetch_per_ticker(func, tickers: List[str], *args) -> Dict[str, List]:
+    """Call ``func(ticker, *args)`` for each ticker so one failure only empties that ticker."""
+    results = await asyncio.gather(
+        *(_run_in_thread_pool(func, ticker, *args) for ticker in tickers),
+        return_exceptions=True,
+    )
+    return {
+        ticker: result if not isinstance(result, Exception) else []
+        for ticker, result in zip(tickers, results)
+    }
+
 
 async def parallel_fetch_prices(
     tickers: List[str],
@@ -177,7 +190,7 @@ async def parallel_fetch_insider_trades(
     api_key: Optional[str] = None,
 ) -> Dict[str, List]:
     """
-    Fetch insider trades for multiple tickers in parallel.
+    Fetch insider trades for multiple tickers with a single batched request.
 
     Args:
         tickers: List of ticker symbols
@@ -192,18 +205,12 @@ async def parallel_fetch_insider_trades(
     """
     set_ticker_markets(ticker_markets or {})
 
-    tasks = []
-    for ticker in tickers:
-        tasks.append(
-            _run_in_thread_pool(get_insider_trades, ticker, end_date, start_date, limit, api_key)
-        )
-
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-
-    return {
-        ticker: result if not isinstance(result, Exception) else []
-        for ticker, result in zip(tickers, results)
-    }
+    # One batched Börsdata request covers every ticker; fall back to per-ticker requests if it fails
+    try:
+        return await _run_in_thread_pool(get_insider_trades_bulk, list(tickers), end_date, start_date, limit, api_key)
+    except Exception as exc:
+        vprint(f"⚠️  Bulk insider trades fetch failed for {len(tickers)} ticker(s), retrying per ticker: {exc}")
+        return await _fetch_per_ticker(get_insider_trades, list(tickers), end_date, start_date, limit, api_key)
 
 
 async def parallel_fetch_company_events(
@@ -216,7 +223,7 @@ async def parallel_fetch_company_events(
     api_key: Optional[str] = None,
 ) -> Dict[str, List]:
     """
-    Fetch company events for multiple tickers in parallel.
+    Fetch company events for multiple tickers with a single batched request.
 
     Args:
         tickers: List of ticker symbols
@@ -231,18 +238,12 @@ async def parallel_fetch_company_events(
     """
     set_ticker_markets(ticker_markets or {})
 
-    tasks = []
-    for ticker in tickers:
-        tasks.append(
-            _run_in_thread_pool(get_company_events, ticker, end_date, start_date, limit, api_key)
-        )
-
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-
-    return {
-        ticker: result if not isinstance(result, Exception) else []
-        for ticker, result in zip(tickers, results)
-    }
+    # One batched Börsdata request covers every ticker; fall back to per-ticker requests if it fails
+    try:
+        return await _run_in_thread_pool(get_company_events_bulk, list(tickers), end_date, start_date, limit, api_key)
+    except Exception as exc:
+        vprint(f"⚠️  Bulk company events fetch failed for {len(tickers)} ticker(s), retrying per ticker: {exc}")
+        return await _fetch_per_ticker(get_company_events, list(tickers), end_date, start_date, limit, api_key)
 
 
 async def parallel_fetch_market_caps(
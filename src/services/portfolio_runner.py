@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import os
 import shutil
 import socket
 import subprocess
+import sys
 import time
 import uuid
 import webbrowser
+from collections import Counter
+from contextlib import closing
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -17,8 +21,8 @@ from urllib.parse import urlparse
 import requests
 import urllib3
 from src.agents.enhanced_portfolio_manager import EnhancedPortfolioManager
-from src.data.borsdata_ticker_mapping import get_ticker_market
-from src.utils.output_formatter import display_results, format_as_portfolio_csv
+from src.data.borsdata_ticker_mapping import GLOBAL, NORDIC, get_ticker_market
+from src.utils.output_formatter import display_results, format_as_portfolio_csv, write_portfolio_csv
 from src.utils.portfolio_loader import Portfolio, Position as PortfolioPosition, load_portfolio, load_universe
 
 # Suppress SSL warnings for self-signed certs
@@ -288,10 +292,14 @@ PortfolioSource = Literal["csv", "ibkr"]
 
 @dataclass(slots=True)
 class RebalanceConfig:
-    """Configuration options consumed by the rebalance service."""
+    """Configuration options consumed by the rebalance service.
 
-    portfolio_path: Optional[Path]
-    universe_path: Optional[Path]
+    ``portfolio_path`` and ``universe_path`` accept any path-like and are stored
+    as ``str`` so the run paths don't re-stringify them; ``output_dir`` stays a Path.
+    """
+
+    portfolio_path: Optional[str]
+    universe_path: Optional[str]
     universe_tickers: Optional[str]
     analysts: str = "all"
     pods: Optional[str] = None  # "all" | comma-separated pod names | None (legacy mode)
@@ -320,6 +328,12 @@ class RebalanceConfig:
     tier_override: Optional[str] = None  # "paper" | "live" -- overrides per-pod tier for this run
     analysis_only: bool = False  # Phase 1 daemon mode: return after proposals, skip execution
 
+    def __post_init__(self) -> None:
+        if self.portfolio_path is not None:
+            self.portfolio_path = os.fspath(self.portfolio_path)
+        if self.universe_path is not None:
+            self.universe_path = os.fspath(self.universe_path)
+
 
 @dataclass(slots=True)
 class RebalanceOutcome:
@@ -354,7 +368,7 @@ def run_rebalance(config: RebalanceConfig) -> RebalanceOutcome:
         print(f"\n✓ Loaded portfolio with {len(portfolio.positions)} positions")
 
     universe_list = load_universe(
-        str(config.universe_path) if config.universe_path else None,
+        config.universe_path,
         config.universe_tickers,
         verbose=True,  # Show skipped delisted tickers
     )
@@ -388,7 +402,7 @@ def run_rebalance(config: RebalanceConfig) -> RebalanceOutcome:
             analysts=analyst_list,
             universe=universe_list,
             portfolio_source=config.portfolio_source,
-            portfolio_path=str(config.portfolio_path) if config.portfolio_path else None,
+            portfolio_path=config.portfolio_path,
             config_json=_json.dumps(config_snapshot, default=str, sort_keys=True),
         )
     except Exception:
@@ -410,12 +424,13 @@ def run_rebalance(config: RebalanceConfig) -> RebalanceOutcome:
         governor_profile=config.governor_profile,
     )
 
-    results = manager.generate_rebalancing_recommendations(
-        max_holdings=config.max_holdings,
-        max_position=config.max_position,
-        min_position=config.min_position,
-        min_trade_size=config.min_trade,
-    )
+    with closing(manager):
+        results = manager.generate_rebalancing_recommendations(
+            max_holdings=config.max_holdings,
+            max_position=config.max_position,
+            min_position=config.min_position,
+            min_trade_size=config.min_trade,
+        )
 
     display_results(results, config.verbose)
 
@@ -423,13 +438,12 @@ def run_rebalance(config: RebalanceConfig) -> RebalanceOutcome:
     if not config.dry_run:
         output_dir = config.output_dir or Path.cwd()
         output_path = output_dir / f"portfolio_{datetime.now().strftime('%Y%m%d')}.csv"
-        df = format_as_portfolio_csv(results)
-        df.to_csv(output_path, index=False)
+        row_count = write_portfolio_csv(results, output_path)
         print(f"\n✅ Rebalanced portfolio saved to: {output_path}")
         print(f"   Next run: python src/portfolio_manager.py --portfolio {output_path.name} --universe ...")
-        if not df.empty:
+        if row_count:
             print("\n📄 Portfolio snapshot:")
-            print(df.to_string(index=False))
+            print(format_as_portfolio_csv(results).to_string(index=False, na_rep=""))
         else:
             print("\n📄 Portfolio snapshot: (no positions)")
     else:
@@ -473,7 +487,7 @@ def run_pods(config: RebalanceConfig) -> RebalanceOutcome:
         print(f"\n✓ Loaded portfolio with {len(portfolio.positions)} positions")
 
     universe_list = load_universe(
-        str(config.universe_path) if config.universe_path else None,
+        config.universe_path,
         config.universe_tickers,
         verbose=True,
     )
@@ -508,7 +522,7 @@ def run_pods(config: RebalanceConfig) -> RebalanceOutcome:
                 analysts=[pod.analyst],
                 universe=universe_list,
                 portfolio_source=config.portfolio_source,
-                portfolio_path=str(config.portfolio_path) if config.portfolio_path else None,
+                portfolio_path=config.portfolio_path,
                 config_json=_json.dumps(config_snapshot, default=str, sort_keys=True),
                 pod_id=pod.name,
             )
@@ -532,7 +546,8 @@ def run_pods(config: RebalanceConfig) -> RebalanceOutcome:
             governor_profile=config.governor_profile,
         )
 
-        signals = manager._collect_analyst_signals()
+        with closing(manager):
+            signals = manager._collect_analyst_signals()
         print(f"  Signals: {len(signals)} collected")
 
         # Generate portfolio proposal
@@ -758,8 +773,7 @@ def run_pods(config: RebalanceConfig) -> RebalanceOutcome:
     if not config.dry_run:
         output_dir = config.output_dir or Path.cwd()
         output_path = output_dir / f"portfolio_{datetime.now().strftime('%Y%m%d')}.csv"
-        df = format_as_portfolio_csv(results)
-        df.to_csv(output_path, index=False)
+        write_portfolio_csv(results, output_path)
         print(f"\n✅ Rebalanced portfolio saved to: {output_path}")
     else:
         print("\n⚠️  Dry-run mode - no files saved")
@@ -826,7 +840,7 @@ def execute_proposals(
     # Load portfolio and universe
     portfolio = _load_portfolio_from_source(config)
     universe_list = load_universe(
-        str(config.universe_path) if config.universe_path else None,
+        config.universe_path,
         config.universe_tickers,
     )
     if not universe_list:
@@ -1069,11 +1083,12 @@ def _build_ticker_market_map(universe: List[str]) -> tuple[Dict[str, str], List[
         if market:
             ticker_markets[ticker] = market
         else:
-            ticker_markets[ticker] = "global"
+            ticker_markets[ticker] = GLOBAL
             unknown.append(ticker)
 
-    global_count = sum(1 for v in ticker_markets.values() if v.lower() == "global")
-    nordic_count = sum(1 for v in ticker_markets.values() if v == "Nordic")
+    counts = Counter(ticker_markets.values())
+    global_count = counts[GLOBAL]
+    nordic_count = counts[NORDIC]
     print(f"✓ Market routing: {global_count} global, {nordic_count} Nordic\n")
     return ticker_markets, unknown
 
@@ -1104,62 +1119,50 @@ def _ensure_current_holdings_in_universe(portfolio: Portfolio, universe: List[st
     universe.extend(sorted(missing))
 
 
+_FAMOUS_ANALYSTS = (
+    "warren_buffett",
+    "charlie_munger",
+    "stanley_druckenmiller",
+    "peter_lynch",
+    "ben_graham",
+    "phil_fisher",
+    "bill_ackman",
+    "cathie_wood",
+    "michael_burry",
+    "mohnish_pabrai",
+    "rakesh_jhunjhunwala",
+    "aswath_damodaran",
+    "jim_simons",
+)
+_CORE_ANALYSTS = ("fundamentals", "technical", "sentiment", "valuation")
+
+# Analyst presets; identifier-like literals are interned by CPython at compile time
+_ANALYST_GROUPS: Dict[str, tuple[str, ...]] = {
+    "all": _FAMOUS_ANALYSTS + _CORE_ANALYSTS,
+    "basic": ("fundamentals",),
+    "famous": _FAMOUS_ANALYSTS,
+    "core": _CORE_ANALYSTS,
+    "favorites": ("fundamentals", "technical", "jim_simons", "news_sentiment_analyst", "stanley_druckenmiller"),
+}
+
+
 def _resolve_analyst_list(selection: str, test_mode: bool) -> List[str]:
     if test_mode:
         print("🧪 Test mode: Using fundamentals analyst for quick validation")
         return ["fundamentals"]
 
-    normalized = selection.lower().strip()
-    if normalized == "all":
-        return [
-            "warren_buffett",
-            "charlie_munger",
-            "stanley_druckenmiller",
-            "peter_lynch",
-            "ben_graham",
-            "phil_fisher",
-            "bill_ackman",
-            "cathie_wood",
-            "michael_burry",
-            "mohnish_pabrai",
-            "rakesh_jhunjhunwala",
-            "aswath_damodaran",
-            "jim_simons",
-            "fundamentals",
-            "technical",
-            "sentiment",
-            "valuation",
-        ]
-    if normalized == "basic":
-        return ["fundamentals"]
-    if normalized == "famous":
-        return [
-            "warren_buffett",
-            "charlie_munger",
-            "stanley_druckenmiller",
-            "peter_lynch",
-            "ben_graham",
-            "phil_fisher",
-            "bill_ackman",
-            "cathie_wood",
-            "michael_burry",
-            "mohnish_pabrai",
-            "rakesh_jhunjhunwala",
-            "aswath_damodaran",
-            "jim_simons",
-        ]
-    if normalized == "core":
-        return ["fundamentals", "technical", "sentiment", "valuation"]
-    if normalized == "favorites":
-        return ["fundamentals", "technical", "jim_simons", "news_sentiment_analyst", "stanley_druckenmiller"]
-    return [part.strip() for part in selection.split(",") if part.strip()]
+    group = _ANALYST_GROUPS.get(selection.lower().strip())
+    if group is not None:
+        return list(group)
+    # Intern custom IDs: they are used as dict keys throughout the manager and caches
+    return [sys.intern(name) for name in (part.strip() for part in selection.split(",")) if name]
 
 
 def _load_portfolio_from_source(config: RebalanceConfig) -> Portfolio:
     if config.portfolio_source == "csv":
         if not config.portfolio_path:
             raise ValueError("Portfolio path is required for CSV input")
-        return load_portfolio(str(config.portfolio_path))
+        return load_portfolio(config.portfolio_path)
 
     if config.portfolio_source == "ibkr":
         from src.integrations.ibkr_client import IBKRClient
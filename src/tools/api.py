@@ -1,4 +1,10 @@
 import datetime
+import re
+import threading
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+from operator import itemgetter
+
 import pandas as pd
 
 from src.data.cache import get_cache
@@ -12,18 +18,20 @@ from src.data.models import (
 from src.data.borsdata_client import BorsdataAPIError, BorsdataClient
 from src.data.borsdata_kpis import FinancialMetricsAssembler
 from src.data.borsdata_reports import LineItemAssembler
+from src.data.borsdata_ticker_mapping import GLOBAL
 from pydantic import BaseModel
 
-# Global mapping for ticker markets
-_ticker_markets = {}
+# Upper-cased tickers that resolve against Börsdata's global instrument list
+_global_tickers: frozenset[str] = frozenset()
 
 def set_ticker_markets(ticker_markets: dict[str, str]) -> None:
     """Set the market mapping for each ticker (Nordic/Global)."""
-    global _ticker_markets
-    _ticker_markets = ticker_markets or {}
+    global _global_tickers
+    _global_tickers = frozenset(ticker.upper() for ticker, market in (ticker_markets or {}).items() if market and market.lower() == GLOBAL)
 
 def use_global_for_ticker(ticker: str) -> bool:
-    return _ticker_markets.get(ticker.upper(), "").lower() == "global"
+    # Callers almost always pass canonical upper-case tickers, so try the exact string first
+    return ticker in _global_tickers or ticker.upper() in _global_tickers
 
 # Global cache instance
 _cache = get_cache()
@@ -32,18 +40,80 @@ _financial_metrics_assembler = FinancialMetricsAssembler(_borsdata_client)
 _line_item_assembler = LineItemAssembler(_borsdata_client)
 
 
+# Clients for explicit API keys, reused so their HTTP session, rate limiter and
+# instrument tables persist across calls; the least recently used key is evicted beyond the cap.
+# Callers run on thread-pool workers, so every access goes through _clients_lock.
+_MAX_CACHED_CLIENTS = 8
+_borsdata_clients: OrderedDict[str, BorsdataClient] = OrderedDict()
+_clients_lock = threading.Lock()
+
+
 def _get_borsdata_client(api_key: str | None) -> BorsdataClient:
     """Return a Börsdata client configured with the requested API key."""
-    if api_key:
-        return BorsdataClient(api_key=api_key)
-    return _borsdata_client
+    if not api_key:
+        return _borsdata_client
+
+    with _clients_lock:
+        client = _borsdata_clients.get(api_key)
+        if client is not None:
+            _borsdata_clients.move_to_end(api_key)
+            return client
+
+        if len(_borsdata_clients) >= _MAX_CACHED_CLIENTS:
+            evicted_key, _ = _borsdata_clients.popitem(last=False)
+            _financial_metrics_assemblers.pop(evicted_key, None)
+            _line_item_assemblers.pop(evicted_key, None)
+        client = _borsdata_clients[api_key] = BorsdataClient(api_key=api_key)
+        return client
+
+
+# Assemblers for non-default API keys, kept so their KPI caches survive between calls
+_financial_metrics_assemblers: dict[str, FinancialMetricsAssembler] = {}
+_line_item_assemblers: dict[str, LineItemAssembler] = {}
+
+
+def _get_financial_metrics_assembler(client: BorsdataClient, api_key: str | None) -> FinancialMetricsAssembler:
+    """Return the financial metrics assembler bound to ``api_key``, creating it on first use."""
+    if client is _borsdata_client:
+        return _financial_metrics_assembler
+    with _clients_lock:
+        assembler = _financial_metrics_assemblers.get(api_key)
+        if assembler is None:
+            assembler = _financial_metrics_assemblers[api_key] = FinancialMetricsAssembler(client)
+        return assembler
+
+
+def _get_line_item_assembler(client: BorsdataClient, api_key: str | None) -> LineItemAssembler:
+    """Return the line item assembler bound to ``api_key``, creating it on first use."""
+    if client is _borsdata_client:
+        return _line_item_assembler
+    with _clients_lock:
+        assembler = _line_item_assemblers.get(api_key)
+        if assembler is None:
+            assembler = _line_item_assemblers[api_key] = LineItemAssembler(client)
+        return assembler
+
 
+_ISO_DATE_RE = re.compile(r"(\d{4}-\d{2}-\d{2})(?:$|[T ])")
 
+
+@lru_cache(maxsize=4096)
 def _normalise_calendar_date(raw: str | None) -> str | None:
     """Convert Börsdata calendar timestamps into YYYY-MM-DD strings."""
     if not raw:
         return None
 
+    # Börsdata timestamps start with the calendar date, so slice it off directly. The regex only
+    # checks the shape, so still parse the slice to reject impossible dates such as 2023-02-30.
+    match = _ISO_DATE_RE.match(raw)
+    if match:
+        date_str = match.group(1)
+        try:
+            datetime.date.fromisoformat(date_str)
+        except ValueError:
+            return None
+        return date_str
+
     cleaned = raw.replace("Z", "+00:00")
     try:
         dt = datetime.datetime.fromisoformat(cleaned)
@@ -65,14 +135,18 @@ def _make_event_id(category: str, instrument_id: int, date: str, *extras: str |
     return f"{base}:{joined_suffix}" if joined_suffix else base
 
 
+# Börsdata price bar keys mapped to Price fields, in the order the model declares them
+_PRICE_FIELDS = {"o": "open", "c": "close", "h": "high", "l": "low", "v": "volume", "d": "time"}
+
+
 def get_prices(ticker: str, start_date: str, end_date: str, api_key: str = None) -> list[Price]:
     """Fetch price data from cache or API."""
     # Create a cache key that includes all parameters to ensure exact matches
     cache_key = f"{ticker}_{start_date}_{end_date or 'none'}"
 
-    # Check cache first - simple exact match
+    # Check cache first - simple exact match; cached rows were validated on the way in
     if cached_data := _cache.get_prices(cache_key):
-        return [Price(**price) for price in cached_data]
+        return [Price.model_construct(**price) for price in cached_data]
 
     client = _get_borsdata_client(api_key)
 
@@ -89,39 +163,28 @@ def get_prices(ticker: str, start_date: str, end_date: str, api_key: str = None)
         print(f"Could not fetch prices for {ticker}: {exc}")
         return []
 
-    prices: list[Price] = []
-    for entry in raw_prices:
-        date_str = entry.get("d")
-        close_value = entry.get("c")
-        if not date_str or close_value is None:
-            continue
-
-        def _numerical(value, fallback):
-            return float(value) if value is not None else float(fallback)
-
-        open_value = _numerical(entry.get("o"), close_value)
-        high_value = _numerical(entry.get("h"), close_value)
-        low_value = _numerical(entry.get("l"), close_value)
-        volume_value = int(entry.get("v") or 0)
+    if not raw_prices:
+        return []
 
-        time_value = date_str if "T" in date_str else f"{date_str}T00:00:00Z"
+    # Normalise the whole response column-wise instead of row by row
+    frame = pd.DataFrame.from_records(raw_prices, columns=list(_PRICE_FIELDS)).rename(columns=_PRICE_FIELDS)
+    frame = frame[frame["time"].ne("")].dropna(subset=["time", "close"])
+    if frame.empty:
+        return []
 
-        prices.append(
-            Price(
-                open=open_value,
-                close=float(close_value),
-                high=high_value,
-                low=low_value,
-                volume=volume_value,
-                time=time_value,
-            )
-        )
+    frame = frame.astype({"open": "float64", "close": "float64", "high": "float64", "low": "float64"})
+    # Missing open/high/low fall back to the close of the same bar
+    intraday = frame[["open", "high", "low"]]
+    frame[["open", "high", "low"]] = intraday.where(intraday.notna(), frame["close"], axis=0)
+    frame["volume"] = pd.to_numeric(frame["volume"], errors="coerce").fillna(0).astype("int64")
+    dates = frame["time"].astype(str)
+    frame["time"] = dates.where(dates.str.contains("T", regex=False), dates + "T00:00:00Z")
 
-    if not prices:
-        return []
+    records = frame.to_dict("records")
+    prices = [Price.model_construct(**record) for record in records]
 
     # Cache the results using the comprehensive cache key
-    _cache.set_prices(cache_key, [p.model_dump() for p in prices])
+    _cache.set_prices(cache_key, records)
     return prices
 
 
@@ -138,10 +201,10 @@ def get_financial_metrics(
 
     # Check cache first - simple exact match
     if cached_data := _cache.get_financial_metrics(cache_key):
-        return [FinancialMetrics(**metric) for metric in cached_data]
+        return [FinancialMetrics.model_construct(**metric) for metric in cached_data]
 
     client = _get_borsdata_client(api_key)
-    assembler = _financial_metrics_assembler if client is _borsdata_client else FinancialMetricsAssembler(client)
+    assembler = _get_financial_metrics_assembler(client, api_key)
 
     try:
         financial_metrics = assembler.assemble(
@@ -160,11 +223,18 @@ def get_financial_metrics(
     if not financial_metrics:
         return []
 
-    # Cache the results as dicts using the comprehensive cache key
-    _cache.set_financial_metrics(cache_key, [m.model_dump() for m in financial_metrics])
+    # Cache the results as dicts using the comprehensive cache key; the models are flat,
+    # so copying __dict__ matches model_dump() without walking the serializer
+    _cache.set_financial_metrics(cache_key, [dict(m.__dict__) for m in financial_metrics])
     return financial_metrics
 
 
+class DynamicModel(BaseModel):
+    """Attribute-access wrapper for assembled line-item records with arbitrary fields."""
+
+    model_config = {"extra": "allow"}
+
+
 def search_line_items(
     ticker: str,
     line_items: list[str],
@@ -179,7 +249,7 @@ def search_line_items(
         return []
 
     client = _get_borsdata_client(api_key)
-    assembler = _line_item_assembler if client is _borsdata_client else LineItemAssembler(client)
+    assembler = _get_line_item_assembler(client, api_key)
 
     try:
         records = assembler.assemble(
@@ -199,10 +269,34 @@ def search_line_items(
     if not records:
         return []
 
-    class DynamicModel(BaseModel):
-        model_config = {"extra": "allow"}
+    return [DynamicModel.model_construct(**record) for record in records]
+
+
+def _resolve_instruments(client: BorsdataClient, tickers: list[str], api_key: str | None) -> dict[str, dict]:
+    """Look up the Börsdata instrument for each ticker, skipping unknown tickers."""
+    instruments: dict[str, dict] = {}
+    for ticker in tickers:
+        try:
+            instrument = client.get_instrument(ticker, api_key=api_key, use_global=use_global_for_ticker(ticker))
+        except BorsdataAPIError as exc:
+            # Log the error for debugging, but don't crash the agent
+            print(f"Could not fetch instrument for {ticker}: {exc}")
+            continue
+
+        if instrument.get("insId") is not None:
+            instruments[ticker] = instrument
+    return instruments
 
-    return [DynamicModel(**record) for record in records]
+
+def _group_rows_by_instrument(rows: list[dict], instrument_ids: list[int]) -> dict[int, list[dict]]:
+    """Bucket Börsdata rows by their insId in a single pass."""
+    # Rows without an insId can only be attributed when a single instrument was requested
+    fallback_id = instrument_ids[0] if len(instrument_ids) == 1 else None
+    grouped: dict[int, list[dict]] = defaultdict(list)
+    for row in rows:
+        instrument_id = row.get("insId")
+        grouped[fallback_id if instrument_id is None else instrument_id].append(row)
+    return grouped
 
 
 def get_insider_trades(
@@ -213,35 +307,79 @@ def get_insider_trades(
     api_key: str = None,
 ) -> list[InsiderTrade]:
     """Fetch insider trades using Börsdata holdings endpoints."""
+    return get_insider_trades_bulk([ticker], end_date, start_date=start_date, limit=limit, api_key=api_key)[ticker]
+
+
+def get_insider_trades_bulk(
+    tickers: list[str],
+    end_date: str,
+    start_date: str | None = None,
+    limit: int = 1000,
+    api_key: str = None,
+) -> dict[str, list[InsiderTrade]]:
+    """Fetch insider trades for several tickers with a single Börsdata holdings request."""
+
+    results: dict[str, list[InsiderTrade]] = {}
+    cache_keys: dict[str, str] = {}
+    for ticker in tickers:
+        cache_key = f"{ticker}_{start_date or 'none'}_{end_date}_{limit}"
+        if cached_data := _cache.get_insider_trades(cache_key):
+            results[ticker] = [InsiderTrade.model_construct(**trade) for trade in cached_data]
+        else:
+            results[ticker] = []
+            cache_keys[ticker] = cache_key
 
-    cache_key = f"{ticker}_{start_date or 'none'}_{end_date}_{limit}"
-    if cached_data := _cache.get_insider_trades(cache_key):
-        return [InsiderTrade(**trade) for trade in cached_data]
+    if not cache_keys:
+        return results
 
     client = _get_borsdata_client(api_key)
+    instruments = _resolve_instruments(client, list(cache_keys), api_key)
+    if not instruments:
+        return results
+
+    instrument_ids = list(dict.fromkeys(instrument["insId"] for instrument in instruments.values()))
+
+    # Validate the window once; rows are then filtered by plain string comparison
+    datetime.date.fromisoformat(end_date)
+    if start_date:
+        datetime.date.fromisoformat(start_date)
 
     try:
-        instrument = client.get_instrument(ticker, api_key=api_key, use_global=use_global_for_ticker(ticker))
+        rows = client.get_insider_holdings(instrument_ids, api_key=api_key)
     except BorsdataAPIError as exc:
-        # Log the error for debugging, but don't crash the agent
-        print(f"Could not fetch instrument for {ticker}: {exc}")
-        return []
+        raise Exception(f"Error fetching Börsdata insider holdings for {', '.join(instruments)}: {exc}") from exc
 
-    instrument_id = instrument.get("insId")
-    if instrument_id is None:
-        return []
+    rows_by_instrument = _group_rows_by_instrument(rows, instrument_ids)
+
+    for ticker, instrument in instruments.items():
+        records = _build_insider_trade_records(ticker, instrument.get("name"), rows_by_instrument.get(instrument["insId"], []), end_date, start_date)
+        if not records:
+            continue
 
-    issuer_name = instrument.get("name")
+        # Both dates are always populated by the record builder, so no None guards are needed
+        records.sort(key=itemgetter("filing_date", "transaction_date"), reverse=True)
+        records = records[:limit]
 
-    end_dt = datetime.date.fromisoformat(end_date)
-    start_dt = datetime.date.fromisoformat(start_date) if start_date else None
+        # Cache the field dicts and build the models from the same records
+        _cache.set_insider_trades(cache_keys[ticker], records)
+        results[ticker] = [InsiderTrade.model_construct(**record) for record in records]
 
-    try:
-        rows = client.get_insider_holdings([instrument_id], api_key=api_key)
-    except BorsdataAPIError as exc:
-        raise Exception(f"Error fetching Börsdata insider holdings for {ticker}: {exc}") from exc
+    return results
 
-    trades: list[InsiderTrade] = []
+
+# Börsdata insider transaction types that add to a holding; anything else is a disposal
+_ACQUISITION_TRANSACTION_TYPES = frozenset({None, 0, 1})
+
+
+def _build_insider_trade_records(
+    ticker: str,
+    issuer_name: str | None,
+    rows: list[dict],
+    end_date: str,
+    start_date: str | None,
+) -> list[dict]:
+    """Convert Börsdata insider holding rows for one instrument into InsiderTrade field dicts."""
+    records: list[dict] = []
 
     for row in rows:
         transaction_date_str = _normalise_calendar_date(row.get("transactionDate"))
@@ -256,14 +394,10 @@ def get_insider_trades(
         if transaction_date_str is None or filing_date_str is None:
             continue
 
-        try:
-            transaction_date_dt = datetime.date.fromisoformat(transaction_date_str)
-        except ValueError:
-            continue
-
-        if transaction_date_dt > end_dt:
+        # _normalise_calendar_date only yields real YYYY-MM-DD dates, which order lexicographically
+        if transaction_date_str > end_date:
             continue
-        if start_dt and transaction_date_dt < start_dt:
+        if start_date and transaction_date_str < start_date:
             continue
 
         raw_shares = row.get("shares")
@@ -275,11 +409,7 @@ def get_insider_trades(
         except (TypeError, ValueError):
             continue
 
-        transaction_type = row.get("transactionType")
-        if transaction_type not in (None, 0, 1):
-            shares_value = -abs(shares_value)
-        else:
-            shares_value = abs(shares_value)
+        shares_value = abs(shares_value) if row.get("transactionType") in _ACQUISITION_TRANSACTION_TYPES else -abs(shares_value)
 
         price_raw = row.get("price")
         amount_raw = row.get("amount")
@@ -299,31 +429,25 @@ def get_insider_trades(
         if isinstance(owner_position, str):
             is_board_director = "director" in owner_position.lower()
 
-        trade = InsiderTrade(
-            ticker=ticker,
-            issuer=issuer_name,
-            name=row.get("ownerName"),
-            title=owner_position,
-            is_board_director=is_board_director,
-            transaction_date=transaction_date_str,
-            transaction_shares=shares_value,
-            transaction_price_per_share=price_value,
-            transaction_value=amount_value,
-            shares_owned_before_transaction=None,
-            shares_owned_after_transaction=None,
-            security_title=None,
-            filing_date=filing_date_str,
+        records.append(
+            {
+                "ticker": ticker,
+                "issuer": issuer_name,
+                "name": row.get("ownerName"),
+                "title": owner_position,
+                "is_board_director": is_board_director,
+                "transaction_date": transaction_date_str,
+                "transaction_shares": shares_value,
+                "transaction_price_per_share": price_value,
+                "transaction_value": amount_value,
+                "shares_owned_before_transaction": None,
+                "shares_owned_after_transaction": None,
+                "security_title": None,
+                "filing_date": filing_date_str,
+            }
         )
-        trades.append(trade)
-
-    if not trades:
-        return []
 
-    trades.sort(key=lambda item: (item.filing_date or "", item.transaction_date or ""), reverse=True)
-    trades = trades[:limit]
-
-    _cache.set_insider_trades(cache_key, [trade.model_dump() for trade in trades])
-    return trades
+    return records
 
 
 def get_company_events(
@@ -334,52 +458,103 @@ def get_company_events(
     api_key: str = None,
 ) -> list[CompanyEvent]:
     """Fetch company calendar events (reports + dividends) for a ticker."""
+    return get_company_events_bulk([ticker], end_date, start_date=start_date, limit=limit, api_key=api_key)[ticker]
 
-    cache_key = f"{ticker}_{start_date or 'none'}_{end_date}_{limit}"
-    if cached_data := _cache.get_company_events(cache_key):
-        return [CompanyEvent(**event) for event in cached_data]
+
+def get_company_events_bulk(
+    tickers: list[str],
+    end_date: str,
+    start_date: str | None = None,
+    limit: int = 1000,
+    api_key: str = None,
+) -> dict[str, list[CompanyEvent]]:
+    """Fetch calendar events for several tickers with one report and one dividend calendar request."""
+
+    results: dict[str, list[CompanyEvent]] = {}
+    cache_keys: dict[str, str] = {}
+    for ticker in tickers:
+        cache_key = f"{ticker}_{start_date or 'none'}_{end_date}_{limit}"
+        if cached_data := _cache.get_company_events(cache_key):
+            results[ticker] = [CompanyEvent.model_construct(**event) for event in cached_data]
+        else:
+            results[ticker] = []
+            cache_keys[ticker] = cache_key
+
+    if not cache_keys:
+        return results
 
     client = _get_borsdata_client(api_key)
+    instruments = _resolve_instruments(client, list(cache_keys), api_key)
+    if not instruments:
+        return results
+
+    instrument_ids = list(dict.fromkeys(instrument["insId"] for instrument in instruments.values()))
+
+    # Validate the window once; events are then filtered by plain string comparison
+    datetime.date.fromisoformat(end_date)
+    if start_date:
+        datetime.date.fromisoformat(start_date)
 
     try:
-        instrument = client.get_instrument(ticker, api_key=api_key, use_global=use_global_for_ticker(ticker))
+        report_calendar = client.get_report_calendar(instrument_ids, api_key=api_key)
+        dividend_calendar = client.get_dividend_calendar(instrument_ids, api_key=api_key)
     except BorsdataAPIError as exc:
         # Log the error for debugging, but don't crash the agent
-        print(f"Could not fetch instrument for {ticker}: {exc}")
-        return []
+        print(f"Could not fetch calendar data for {', '.join(instruments)}: {exc}")
+        return results
 
-    instrument_id = instrument.get("insId")
-    if instrument_id is None:
-        return []
+    reports_by_instrument = _group_rows_by_instrument(report_calendar, instrument_ids)
+    dividends_by_instrument = _group_rows_by_instrument(dividend_calendar, instrument_ids)
 
-    end_date_obj = datetime.date.fromisoformat(end_date)
-    start_date_obj = datetime.date.fromisoformat(start_date) if start_date else None
+    for ticker, instrument in instruments.items():
+        instrument_id = instrument["insId"]
+        records = _build_company_event_records(
+            ticker,
+            instrument_id,
+            reports_by_instrument.get(instrument_id, []),
+            dividends_by_instrument.get(instrument_id, []),
+            end_date,
+            start_date,
+        )
+        if not records:
+            continue
 
-    try:
-        report_calendar = client.get_report_calendar([instrument_id], api_key=api_key)
-        dividend_calendar = client.get_dividend_calendar([instrument_id], api_key=api_key)
-    except BorsdataAPIError as exc:
-        # Log the error for debugging, but don't crash the agent
-        print(f"Could not fetch calendar data for {ticker}: {exc}")
-        return []
+        # Sort reverse-chronologically to surface the most recent events first
+        records.sort(key=itemgetter("date"), reverse=True)
+        records = records[:limit]
+
+        # Cache the field dicts and build the models from the same records
+        _cache.set_company_events(cache_keys[ticker], records)
+        results[ticker] = [CompanyEvent.model_construct(**record) for record in records]
+
+    return results
 
-    events: list[CompanyEvent] = []
+
+def _build_company_event_records(
+    ticker: str,
+    instrument_id: int,
+    report_calendar: list[dict],
+    dividend_calendar: list[dict],
+    end_date: str,
+    start_date: str | None,
+) -> list[dict]:
+    """Convert Börsdata report and dividend calendar rows for one instrument into CompanyEvent field dicts."""
+    records: list[dict] = []
 
     for report in report_calendar:
         event_date_str = _normalise_calendar_date(report.get("releaseDate"))
         if not event_date_str:
             continue
 
-        event_date_obj = datetime.date.fromisoformat(event_date_str)
-        if event_date_obj > end_date_obj:
+        if event_date_str > end_date:
             continue
-        if start_date_obj and event_date_obj < start_date_obj:
+        if start_date and event_date_str < start_date:
             continue
 
         report_type = report.get("reportType")
         title = f"Report release ({report_type})" if report_type else "Report release"
-        events.append(
-            CompanyEvent(
+        records.append(
+            dict(
                 ticker=ticker,
                 date=event_date_str,
                 category="report",
@@ -395,10 +570,9 @@ def get_company_events(
         if not event_date_str:
             continue
 
-        event_date_obj = datetime.date.fromisoformat(event_date_str)
-        if event_date_obj > end_date_obj:
+        if event_date_str > end_date:
             continue
-        if start_date_obj and event_date_obj < start_date_obj:
+        if start_date and event_date_str < start_date:
             continue
 
         amount_raw = dividend.get("amountPaid")
@@ -412,8 +586,8 @@ def get_company_events(
         title = f"Dividend{amount_label}{currency_label}".strip()
         description = "Börsdata dividend calendar entry"
 
-        events.append(
-            CompanyEvent(
+        records.append(
+            dict(
                 ticker=ticker,
                 date=event_date_str,
                 category="dividend",
@@ -433,15 +607,7 @@ def get_company_events(
             )
         )
 
-    if not events:
-        return []
-
-    # Sort reverse-chronologically to surface the most recent events first
-    events.sort(key=lambda e: e.date, reverse=True)
-    events = events[:limit]
-
-    _cache.set_company_events(cache_key, [event.model_dump() for event in events])
-    return events
+    return records
 
 
 def get_market_cap(
@@ -462,14 +628,16 @@ def get_market_cap(
     return market_cap
 
 
+_PRICE_FRAME_DTYPES = {"open": "float64", "close": "float64", "high": "float64", "low": "float64", "volume": "int64", "time": "object"}
+
+
 def prices_to_df(prices: list[Price]) -> pd.DataFrame:
     """Convert prices to a DataFrame."""
-    df = pd.DataFrame([p.model_dump() for p in prices])
+    df = pd.DataFrame.from_records([p.__dict__ for p in prices], columns=list(_PRICE_FRAME_DTYPES))
     df["Date"] = pd.to_datetime(df["time"])
     df.set_index("Date", inplace=True)
-    numeric_cols = ["open", "close", "high", "low", "volume"]
-    for col in numeric_cols:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
+    # Price already guarantees numeric fields, so a single cast replaces per-column coercion
+    df = df.astype(_PRICE_FRAME_DTYPES)
     df.sort_index(inplace=True)
     return df
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from itertools import product
 from typing import Dict, Tuple
 
 _MINOR_CURRENCY_FACTORS: Dict[str, Tuple[str, float]] = {
@@ -10,6 +11,14 @@ _MINOR_CURRENCY_FACTORS: Dict[str, Tuple[str, float]] = {
     "GBP": ("GBP", 1.0),
 }
 
+# Every casing of the known codes, resolved the way an exact-then-uppercase lookup would,
+# so callers need a single dict probe
+_CURRENCY_LOOKUP: Dict[str, Tuple[str, float]] = {
+    variant: _MINOR_CURRENCY_FACTORS.get(variant) or _MINOR_CURRENCY_FACTORS[variant.upper()]
+    for code in _MINOR_CURRENCY_FACTORS
+    for variant in ("".join(chars) for chars in product(*((ch.upper(), ch.lower()) for ch in code)))
+}
+
 
 def normalize_currency_code(currency: str | None) -> str:
     """Return the major ISO currency code for a Börsdata currency identifier."""
@@ -18,9 +27,7 @@ def normalize_currency_code(currency: str | None) -> str:
         return ""
 
     raw_code = currency.strip()
-    mapping = _MINOR_CURRENCY_FACTORS.get(raw_code)
-    if mapping is None:
-        mapping = _MINOR_CURRENCY_FACTORS.get(raw_code.upper())
+    mapping = _CURRENCY_LOOKUP.get(raw_code)
     if mapping:
         return mapping[0]
     return raw_code.upper()
@@ -37,9 +44,7 @@ def normalize_price_and_currency(price: float, currency: str | None) -> tuple[fl
         return price, ""
 
     raw_code = currency.strip()
-    mapping = _MINOR_CURRENCY_FACTORS.get(raw_code)
-    if mapping is None:
-        mapping = _MINOR_CURRENCY_FACTORS.get(raw_code.upper())
+    mapping = _CURRENCY_LOOKUP.get(raw_code)
 
     if not mapping:
         return price, raw_code.upper()
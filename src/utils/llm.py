@@ -5,7 +5,10 @@ from pydantic import BaseModel
 from src.llm.models import get_model, get_model_info
 from src.utils.progress import progress
 from src.graph.state import AgentState
-from src.data.llm_response_cache import get_llm_cache
+from src.data.llm_response_cache import get_llm_cache, hash_prompt
+
+# Prompts at or below this length skip the persistent response cache
+MIN_CACHEABLE_PROMPT_CHARS = 200
 
 
 def call_llm(
@@ -18,7 +21,8 @@ def call_llm(
 ) -> BaseModel:
     """
     Makes an LLM call with retry logic, handling both JSON supported and non-JSON supported models.
-    Uses persistent cache with 7-day freshness check to avoid redundant API calls.
+    Uses persistent cache with 7-day freshness check to avoid redundant API calls
+    for prompts longer than MIN_CACHEABLE_PROMPT_CHARS.
 
     Args:
         prompt: The prompt to send to the LLM
@@ -67,17 +71,24 @@ def call_llm(
         if tickers:
             ticker = tickers[0]  # Use first ticker as cache key
 
+    use_cache = False
     if ticker and agent_name:
+        # Convert and hash the prompt once; the same key serves the lookup and the store
+        prompt_str = prompt if isinstance(prompt, str) else str(prompt)
+        # Short prompts are cheaper to send than to round-trip through the SQLite cache
+        use_cache = len(prompt_str) > MIN_CACHEABLE_PROMPT_CHARS
+
+    if use_cache:
+        prompt_hash = hash_prompt(prompt_str)
         try:
             cache = get_llm_cache()
-            # Convert prompt to string for hashing
-            prompt_str = str(prompt) if not isinstance(prompt, str) else prompt
 
             # Try to get cached response
             cached_response = cache.get_cached_response(
                 ticker=ticker,
                 analyst_name=agent_name,
                 prompt=prompt_str,
+                prompt_hash=prompt_hash,
             )
 
             if cached_response:
@@ -115,17 +126,16 @@ def call_llm(
                 response_model = result
 
             # Store successful response in cache
-            if ticker and agent_name:
+            if use_cache:
                 try:
-                    cache = get_llm_cache()
-                    prompt_str = str(prompt) if not isinstance(prompt, str) else prompt
-                    cache.store_response(
+                    get_llm_cache().store_response(
                         ticker=ticker,
                         analyst_name=agent_name,
                         prompt=prompt_str,
                         response=response_model,
                         model_name=model_name,
                         model_provider=model_provider,
+                        prompt_hash=prompt_hash,
                     )
                 except Exception as cache_error:
                     # Log cache storage error but don't fail the request
@@ -1,7 +1,33 @@
+from __future__ import annotations
+
+import csv
+import math
+import sys
+from collections import defaultdict, namedtuple
 from datetime import datetime
-from typing import Dict
+from functools import lru_cache
+from io import StringIO
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Summary marker per rebalancing action
+_ACTION_EMOJI = {"ADD": "🟢", "INCREASE": "⬆️", "HOLD": "⏸️", "DECREASE": "⬇️", "SELL": "🔴"}
 
-import pandas as pd
+# Fields of a recommendation that the report reads
+_Recommendation = namedtuple("_Recommendation", "action ticker current_shares target_shares value_delta currency current_price reasoning")
+
+# Report layout: column order of the recommendations table and the fixed rules around it
+_TABLE_ACTIONS = ("SELL", "DECREASE", "HOLD", "INCREASE", "ADD")
+_COL_WIDTH = 20
+_TABLE_HEADER = "| " + " | ".join(f"{action:^{_COL_WIDTH}}" for action in _TABLE_ACTIONS) + " |"
+_TABLE_SEP = "+-" + "-+-".join(["-" * _COL_WIDTH] * len(_TABLE_ACTIONS)) + "-+"
+_CELL_FMT = f" {{:<{_COL_WIDTH}}} "
+_BLANK_CELL = _CELL_FMT.format("")
+_HEADER_BAR = "=" * 80
+_RULE = "-" * 40
 
 
 def format_as_portfolio_csv(results: Dict) -> pd.DataFrame:
@@ -9,218 +35,270 @@ def format_as_portfolio_csv(results: Dict) -> pd.DataFrame:
     Convert recommendations to portfolio CSV format
     Maintains the same format as input for next iteration
     """
+    import pandas as pd
 
-    portfolio_data = []
+    # Accumulate columns directly so pandas skips the row-dict to column pivot
+    tickers, shares, cost_basis, currencies, dates_acquired = [], [], [], [], []
 
     # Process updated positions from recommendations
     for rec in results.get("updated_portfolio", {}).get("positions", []):
         if rec["shares"] > 0:  # Only include non-zero positions
-            portfolio_data.append({"ticker": rec["ticker"], "shares": int(rec["shares"]), "cost_basis": round(rec["cost_basis"], 2), "currency": rec["currency"], "date_acquired": rec["date_acquired"]})
+            tickers.append(rec["ticker"])
+            shares.append(int(rec["shares"]))
+            cost_basis.append(round(rec["cost_basis"], 2))
+            currencies.append(rec["currency"])
+            dates_acquired.append(rec["date_acquired"])
 
     # Add cash positions
     for currency, amount in results.get("updated_portfolio", {}).get("cash", {}).items():
         if amount > 0:
-            portfolio_data.append({"ticker": "CASH", "shares": round(amount, 2), "cost_basis": "", "currency": currency, "date_acquired": ""})
+            tickers.append("CASH")
+            shares.append(round(amount, 2))
+            cost_basis.append(float("nan"))  # Exported as an empty field
+            currencies.append(currency)
+            dates_acquired.append("")
 
     # Create DataFrame and sort
-    df = pd.DataFrame(portfolio_data)
-    if not df.empty:
-        # Sort by currency then ticker
-        df = df.sort_values(["currency", "ticker"])
+    df = pd.DataFrame({"ticker": tickers, "shares": shares, "cost_basis": cost_basis, "currency": currencies, "date_acquired": dates_acquired})
+    # shares keeps its inferred dtype so position-only exports write whole share counts (a cash
+    # balance upcasts it to float64, as before); the handful of distinct currencies become a
+    # category so the sort compares integer codes
+    df = df.astype({"cost_basis": "float64", "currency": "category"})
+    if len(df) > 1:
+        # Sort by currency then ticker; zero or one row is already in order
+        df = df.sort_values(["currency", "ticker"], kind="stable", ignore_index=True)
 
     return df
 
 
+def write_portfolio_csv(results: Dict, path: str | Path) -> int:
+    """Write the rebalanced portfolio CSV straight from the results dict.
+
+    Mirrors format_as_portfolio_csv (same columns, filters, share formatting
+    and currency/ticker ordering) without building a DataFrame. The rows are
+    rendered into memory and written to disk in one call. Returns the number
+    of rows written.
+    """
+    updated = results.get("updated_portfolio", {})
+    rows: List[list] = [
+        [rec["ticker"], int(rec["shares"]), round(rec["cost_basis"], 2), rec["currency"], rec["date_acquired"]]
+        for rec in updated.get("positions", [])
+        if rec["shares"] > 0
+    ]
+    cash_rows = [["CASH", round(amount, 2), "", currency, ""] for currency, amount in updated.get("cash", {}).items() if amount > 0]
+    if cash_rows:
+        # A cash balance makes the DataFrame's shares column float64, so share counts print as 10.0
+        for row in rows:
+            row[1] = float(row[1])
+        rows.extend(cash_rows)
+    rows.sort(key=lambda row: (row[3], row[0]))
+
+    buf = StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(["ticker", "shares", "cost_basis", "currency", "date_acquired"])
+    writer.writerows(rows)
+    with open(path, "w", newline="") as handle:
+        handle.write(buf.getvalue())
+    return len(rows)
+
+
+def _format_shares(value: float) -> str:
+    if value is None:
+        return "0"
+    if type(value) is int:
+        return str(value)
+    if isinstance(value, float):
+        # NaN and inf have no integer form, so render them as-is
+        return str(int(value)) if math.isfinite(value) else f"{value:.0f}"
+    return str(int(value))
+
+
+@lru_cache(maxsize=8)
+def _format_exchange_rates(rates: tuple, home_currency: str) -> str:
+    """Report block for the non-home exchange rates, memoised across renders of the same rates."""
+    return "\n".join([f"   1 {currency} = {rate:.4f} {home_currency}" for currency, rate in sorted(rates) if currency != home_currency])
+
+
 def display_results(results: Dict, verbose: bool):
     """Display rebalancing recommendations in table format"""
 
-    print("\n" + "=" * 80)
-    print("PORTFOLIO REBALANCING ANALYSIS")
-    print("=" * 80)
-    print(f"Date: {results.get('analysis_date', datetime.now())}")
+    # Collect the whole report and write it once instead of issuing a print per line
+    buf = StringIO()
+
+    def emit(line: str = "") -> None:
+        buf.write(line)
+        buf.write("\n")
+
+    emit("\n" + _HEADER_BAR)
+    emit("PORTFOLIO REBALANCING ANALYSIS")
+    emit(_HEADER_BAR)
+    emit(f"Date: {results.get('analysis_date', datetime.now())}")
 
     # Current portfolio summary
     current = results.get("current_portfolio", {})
     home_currency = current.get("home_currency", "USD")
     total_value = current.get("total_value", 0)
 
-    print(f"\nCurrent Portfolio Value: {total_value:,.2f} {home_currency}")
-    print(f"Number of Positions: {current.get('num_positions', 0)}")
+    emit(f"\nCurrent Portfolio Value: {total_value:,.2f} {home_currency}")
+    emit(f"Number of Positions: {current.get('num_positions', 0)}")
 
     governor = results.get("governor")
     if governor:
         from src.services.portfolio_governor import format_governor_summary
 
-        print("\nGovernor Summary:")
+        emit("\nGovernor Summary:")
         for line in format_governor_summary(governor):
-            if line.startswith("- "):
-                print(f"  {line}")
-            else:
-                print(f"  {line}")
+            emit(f"  {line}")
 
     # Show exchange rates if available
     exchange_rates = current.get("exchange_rates", {})
     if exchange_rates and len(exchange_rates) > 1:
-        print(f"\nExchange Rates (to {home_currency}):")
-        for currency, rate in sorted(exchange_rates.items()):
-            if currency != home_currency:
-                print(f"   1 {currency} = {rate:.4f} {home_currency}")
+        emit(f"\nExchange Rates (to {home_currency}):")
+        rates_block = _format_exchange_rates(tuple(exchange_rates.items()), home_currency)
+        if rates_block:
+            emit(rates_block)
 
     # Recommendations table organized by action type
     recs = results.get("recommendations", [])
     if recs:
-        print("\n" + "-" * 40)
-        print("RECOMMENDATIONS")
-        print("-" * 40)
-
-        def _format_shares(value: float) -> str:
-            try:
-                if value is None:
-                    return "0"
-                return f"{int(value)}"
-            except (ValueError, TypeError):
-                return f"{value:.0f}"
+        emit("\n" + _RULE)
+        emit("RECOMMENDATIONS")
+        emit(_RULE)
 
         # Group recommendations by action
-        by_action = {
-            "SELL": [],
-            "DECREASE": [],
-            "HOLD": [],
-            "INCREASE": [],
-            "ADD": []
-        }
-
-        for rec in recs:
-            action = rec["action"]
-            if action in by_action:
-                current_shares_num = rec["current_shares"]
-                target_shares_num = rec.get("target_shares", 0.0)
-                current_shares = _format_shares(current_shares_num)
-                target_shares = _format_shares(target_shares_num)
-                change_value = rec.get("value_delta", 0.0)
-                currency = rec.get("currency") or ""
-                change_formatted = f"{change_value:+,.0f} {currency}".strip()
-
-                # Calculate the actual number of shares to trade
-                delta_shares = int(target_shares_num - current_shares_num)
-
-                # Get current price
-                current_price = rec.get("current_price", 0.0)
-                price_str = f"@ {current_price:.2f}" if current_price > 0 else ""
-
-                # Create action description
-                if action == "SELL":
-                    action_desc = f"Sell all {current_shares} {price_str}"
-                elif action == "DECREASE":
-                    action_desc = f"Sell {abs(delta_shares)} {price_str}"
-                elif action == "INCREASE":
-                    action_desc = f"Buy {delta_shares} {price_str}"
-                elif action == "ADD":
-                    action_desc = f"Buy {target_shares} {price_str}"
-                else:  # HOLD
-                    action_desc = f"Hold {current_shares}"
-
-                by_action[action].append({
-                    "ticker": rec["ticker"],
-                    "current": current_shares,
-                    "target": target_shares,
-                    "action_desc": action_desc,
-                    "change": change_formatted,
-                    "reasoning": rec.get("reasoning", "") if verbose else ""
-                })
+        by_action = {action: [] for action in _TABLE_ACTIONS}
+
+        # Normalise the recommendations once so the loop below reads attributes instead of repeated dict lookups
+        rows = [
+            _Recommendation(
+                rec["action"],
+                rec["ticker"],
+                rec["current_shares"],
+                rec.get("target_shares", 0.0),
+                rec.get("value_delta", 0.0),
+                rec.get("currency") or "",
+                rec.get("current_price", 0.0),
+                rec.get("reasoning", "") if verbose else "",
+            )
+            for rec in recs
+            if rec["action"] in by_action
+        ]
+
+        for rec in rows:
+            action = rec.action
+            current_shares = _format_shares(rec.current_shares)
+            target_shares = _format_shares(rec.target_shares)
+            change_formatted = f"{rec.value_delta:+,.0f} {rec.currency}".strip()
+
+            # Calculate the actual number of shares to trade
+            delta_shares = int(rec.target_shares - rec.current_shares)
+
+            # Get current price
+            current_price = rec.current_price
+            price_str = f"@ {current_price:.2f}" if current_price > 0 else ""
+
+            # Create action description
+            if action == "SELL":
+                action_desc = f"Sell all {current_shares} {price_str}"
+            elif action == "DECREASE":
+                action_desc = f"Sell {abs(delta_shares)} {price_str}"
+            elif action == "INCREASE":
+                action_desc = f"Buy {delta_shares} {price_str}"
+            elif action == "ADD":
+                action_desc = f"Buy {target_shares} {price_str}"
+            else:  # HOLD
+                action_desc = f"Hold {current_shares}"
+
+            by_action[action].append({
+                "ticker": rec.ticker,
+                "current": current_shares,
+                "target": target_shares,
+                "action_desc": action_desc,
+                "change": change_formatted,
+                "reasoning": rec.reasoning
+            })
 
         # Calculate max rows needed
         max_rows = max(len(items) for items in by_action.values()) if any(by_action.values()) else 0
 
         if max_rows > 0:
             # Print table header
-            col_width = 20
-            header = "| " + " | ".join([f"{action:^{col_width}}" for action in by_action.keys()]) + " |"
-            separator = "+-" + "-+-".join(["-" * col_width for _ in by_action.keys()]) + "-+"
-
-            print("\n" + separator)
-            print(header)
-            print(separator)
+            emit("\n" + _TABLE_SEP)
+            emit(_TABLE_HEADER)
+            emit(_TABLE_SEP)
 
             # Print table rows - each ticker gets 3 lines
+            num_columns = len(by_action)
+            # Ticker, action description and value change lines for the current row
+            line1_parts = [_BLANK_CELL] * num_columns
+            line2_parts = [_BLANK_CELL] * num_columns
+            line3_parts = [_BLANK_CELL] * num_columns
+            columns = list(by_action.values())
             for row_idx in range(max_rows):
-                # Line 1: Ticker name
-                line1_parts = []
-                for action, items in by_action.items():
-                    if row_idx < len(items):
-                        ticker = f"{items[row_idx]['ticker']}"
-                        line1_parts.append(f" {ticker:<{col_width}} ")
-                    else:
-                        line1_parts.append(f" {'':<{col_width}} ")
-                print("|" + "|".join(line1_parts) + "|")
-
-                # Line 2: Action description (e.g., "Buy 88 @ 4.48" or "Sell all 8 @ 124.52")
-                line2_parts = []
-                for action, items in by_action.items():
-                    if row_idx < len(items):
-                        item = items[row_idx]
-                        action_text = item['action_desc']
-                        # Truncate if too long
-                        if len(action_text) > col_width:
-                            action_text = action_text[:col_width-3] + "..."
-                        line2_parts.append(f" {action_text:<{col_width}} ")
-                    else:
-                        line2_parts.append(f" {'':<{col_width}} ")
-                print("|" + "|".join(line2_parts) + "|")
-
-                # Line 3: Value change
-                line3_parts = []
-                for action, items in by_action.items():
-                    if row_idx < len(items):
-                        change = items[row_idx]['change']
-                        # Truncate if too long
-                        if len(change) > col_width:
-                            change = change[:col_width-3] + "..."
-                        line3_parts.append(f" {change:<{col_width}} ")
-                    else:
-                        line3_parts.append(f" {'':<{col_width}} ")
-                print("|" + "|".join(line3_parts) + "|")
+                # One pass per row fills ticker, action description and value change cells together
+                for col_idx, items in enumerate(columns):
+                    if row_idx >= len(items):
+                        line1_parts[col_idx] = line2_parts[col_idx] = line3_parts[col_idx] = _BLANK_CELL
+                        continue
+
+                    item = items[row_idx]
+                    # Line 2 text: e.g. "Buy 88 @ 4.48" or "Sell all 8 @ 124.52"
+                    action_text = item['action_desc']
+                    change = item['change']
+                    # Truncate if too long
+                    if len(action_text) > _COL_WIDTH:
+                        action_text = action_text[:_COL_WIDTH-3] + "..."
+                    if len(change) > _COL_WIDTH:
+                        change = change[:_COL_WIDTH-3] + "..."
+                    line1_parts[col_idx] = _CELL_FMT.format(f"{item['ticker']}")
+                    line2_parts[col_idx] = _CELL_FMT.format(action_text)
+                    line3_parts[col_idx] = _CELL_FMT.format(change)
+
+                emit("|" + "|".join(line1_parts) + "|")
+                emit("|" + "|".join(line2_parts) + "|")
+                emit("|" + "|".join(line3_parts) + "|")
 
                 # Add separator between items (not after last item)
                 if row_idx < max_rows - 1:
-                    print(separator)
+                    emit(_TABLE_SEP)
 
-            print(separator)
+            emit(_TABLE_SEP)
 
         # Print summary
         counts = {action: len(items) for action, items in by_action.items() if items}
-        print("\n**Summary:**")
+        emit("\n**Summary:**")
         for action, count in counts.items():
-            emoji = {"ADD": "🟢", "INCREASE": "⬆️", "HOLD": "⏸️", "DECREASE": "⬇️", "SELL": "🔴"}.get(action, "")
-            print(f"  {emoji} {count} position(s) to {action.lower()}")
+            emoji = _ACTION_EMOJI.get(action, "")
+            emit(f"  {emoji} {count} position(s) to {action.lower()}")
 
         # Show detailed list if verbose
         if verbose:
-            print("\n" + "-" * 40)
-            print("DETAILED RECOMMENDATIONS")
-            print("-" * 40)
+            emit("\n" + _RULE)
+            emit("DETAILED RECOMMENDATIONS")
+            emit(_RULE)
             for action in by_action.keys():
                 if by_action[action]:
-                    print(f"\n{action}:")
+                    emit(f"\n{action}:")
                     for item in by_action[action]:
-                        print(f"  • {item['ticker']}: {item['action_desc']} → {item['change']}")
+                        emit(f"  • {item['ticker']}: {item['action_desc']} → {item['change']}")
                         if item['reasoning']:
-                            print(f"    Reasoning: {item['reasoning']}")
+                            emit(f"    Reasoning: {item['reasoning']}")
 
     # Show detailed analyst opinions if verbose
     if verbose and "analyst_signals" in results and results["analyst_signals"]:
-        print("\n" + "-" * 40)
-        print("ANALYST OPINIONS")
-        print("-" * 40)
+        emit("\n" + _RULE)
+        emit("ANALYST OPINIONS")
+        emit(_RULE)
 
-        by_ticker = {}
+        by_ticker = defaultdict(list)
         for signal in results["analyst_signals"]:
-            if signal.ticker not in by_ticker:
-                by_ticker[signal.ticker] = []
             by_ticker[signal.ticker].append(signal)
 
         for ticker, signals in by_ticker.items():
-            print(f"\n{ticker}:")
+            emit(f"\n{ticker}:")
             for sig in signals:
                 sentiment = "Bullish" if sig.signal > 0 else "Bearish" if sig.signal < 0 else "Neutral"
-                print(f"  {sig.analyst}: {sentiment} ({sig.signal:+.2f})")
+                emit(f"  {sig.analyst}: {sentiment} ({sig.signal:+.2f})")
+
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
@@ -1,13 +1,10 @@
 import csv
 from dataclasses import dataclass
 from datetime import datetime
-from io import StringIO
 from pathlib import Path
 from typing import Dict, List, Optional
 import warnings
 
-import pandas as pd
-
 
 # Common ISO 4217 currency codes used in markets supported by Börsdata
 VALID_CURRENCIES = {
@@ -16,8 +13,15 @@ VALID_CURRENCIES = {
     "BRL", "MXN", "ZAR", "NZD", "KRW", "TWD", "THB", "IDR", "MYR", "PHP",
 }
 
+# Non-ISO date layouts accepted for date_acquired. Like pandas/dateutil, ambiguous slash and dot
+# dates are read month-first and only fall back to day-first when the month would be invalid.
+_DATE_ACQUIRED_FORMATS = ("%Y/%m/%d", "%m/%d/%Y", "%d/%m/%Y", "%m.%d.%Y", "%d.%m.%Y", "%Y%m%d")
+
+# Whitespace and quote characters trimmed from both ends of a universe ticker
+_TICKER_STRIP_CHARS = " \t\r\n\"'"
 
-@dataclass
+
+@dataclass(slots=True)
 class Position:
     ticker: str
     shares: float
@@ -26,7 +30,7 @@ class Position:
     date_acquired: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Portfolio:
     positions: List[Position]
     cash_holdings: Dict[str, float]  # {'USD': 10000, 'SEK': 75000}
@@ -56,6 +60,27 @@ def validate_portfolio_data(
     return warnings_list
 
 
+def _parse_date_acquired(value: Optional[str]) -> Optional[datetime]:
+    """Parse a date_acquired cell, returning None for blanks."""
+    value = (value or "").strip()
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    # Hand-edited files sometimes use other common layouts; try them in the order pandas would
+    for date_format in _DATE_ACQUIRED_FORMATS:
+        try:
+            return datetime.strptime(value, date_format)
+        except ValueError:
+            continue
+    # Anything else (unpadded ISO, month names, ...) goes through pandas as it always did
+    import pandas as pd
+
+    return pd.to_datetime(value).to_pydatetime()
+
+
 def load_portfolio(portfolio_file: str, validate: bool = True) -> Portfolio:
     """Load portfolio from CSV file.
 
@@ -71,40 +96,42 @@ def load_portfolio(portfolio_file: str, validate: bool = True) -> Portfolio:
     cash_holdings = {}
     validation_warnings = []
 
-    df = pd.read_csv(portfolio_file)
     required_cols = ["ticker", "shares"]
 
-    if not all(col in df.columns for col in required_cols):
-        raise ValueError(f"CSV must contain columns: {required_cols}")
-
-    for row_num, (_, row) in enumerate(df.iterrows(), start=2):  # Start at 2 for header row
-        ticker = row["ticker"].strip()
-        shares = float(row["shares"])
-        cost_basis = float(row["cost_basis"]) if "cost_basis" in row and pd.notna(row["cost_basis"]) else 0
-        currency = row["currency"] if "currency" in row and pd.notna(row["currency"]) else "USD"
-
-        # Handle cash entries
-        if ticker.upper() == "CASH":
-            cash_holdings[currency] = shares
-            continue
-
-        # Validate position data
-        if validate:
-            validation_warnings.extend(
-                validate_portfolio_data(ticker, shares, cost_basis, currency, row_num)
+    with open(portfolio_file, newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f)
+        if not set(required_cols).issubset(reader.fieldnames or ()):
+            raise ValueError(f"CSV must contain columns: {required_cols}")
+
+        for row_num, row in enumerate(reader, start=2):  # Start at 2 for header row
+            ticker = row["ticker"].strip()
+            shares = float(row["shares"])
+            cost_basis = (row.get("cost_basis") or "").strip()
+            cost_basis = float(cost_basis) if cost_basis else 0.0
+            currency = (row.get("currency") or "").strip() or "USD"
+
+            # Handle cash entries
+            if ticker.upper() == "CASH":
+                cash_holdings[currency] = shares
+                continue
+
+            # Validate position data
+            if validate:
+                validation_warnings.extend(
+                    validate_portfolio_data(ticker, shares, cost_basis, currency, row_num)
+                )
+
+            # Regular position
+            positions.append(
+                Position(
+                    ticker=ticker,
+                    shares=shares,
+                    cost_basis=cost_basis,
+                    currency=currency,
+                    date_acquired=_parse_date_acquired(row.get("date_acquired")),
+                )
             )
 
-        # Regular position
-        positions.append(
-            Position(
-                ticker=ticker,
-                shares=shares,
-                cost_basis=cost_basis,
-                currency=currency,
-                date_acquired=pd.to_datetime(row["date_acquired"]) if "date_acquired" in row and pd.notna(row["date_acquired"]) else None,
-            )
-        )
-
     # Emit validation warnings
     if validation_warnings:
         for warning in validation_warnings:
@@ -128,7 +155,7 @@ def load_universe(universe_file: Optional[str] = None, tickers_str: Optional[str
         verbose: If True, print info about skipped delisted tickers
 
     Returns:
-        List of ticker symbols
+        List of unique ticker symbols in first-seen order
     """
     delisted_tickers: List[str] = []
 
@@ -138,13 +165,13 @@ def load_universe(universe_file: Optional[str] = None, tickers_str: Optional[str
         if "#" in ticker:
             ticker = ticker.split("#")[0]
         # Strip whitespace and quotes
-        ticker = ticker.strip().strip('"').strip("'")
+        ticker = ticker.strip(_TICKER_STRIP_CHARS)
         return ticker if ticker else None
 
     def is_comment_line(line: str) -> bool:
         """Check if line is a comment (starts with # or --)"""
         stripped = line.strip()
-        return stripped.startswith("#") or stripped.startswith("--")
+        return stripped.startswith(("#", "--"))
 
     def extract_delisted(line: str) -> Optional[str]:
         """Extract ticker from DELISTED comment line, returns ticker if found"""
@@ -159,50 +186,39 @@ def load_universe(universe_file: Optional[str] = None, tickers_str: Optional[str
             return ticker
         return None
 
-    universe = set()
+    # Collected in file order and deduplicated once at the end
+    universe: List[str] = []
+    add_ticker = universe.append
 
     if universe_file:
         with open(universe_file, "r") as f:
-            content = f.read().strip()
-
-            # First pass: extract delisted tickers from DELISTED comments
-            for line in content.split("\n"):
-                delisted = extract_delisted(line)
-                if delisted:
-                    delisted_tickers.append(delisted)
-
-            # Detect and parse format
-            if "," in content:
-                # CSV format - handles quoted tickers like "ERIC B"
-                # Filter out comment lines before CSV parsing
-                non_comment_lines = [line for line in content.split("\n") if not is_comment_line(line)]
-                csv_content = "\n".join(non_comment_lines)
-                csv_reader = csv.reader(StringIO(csv_content))
-                for row in csv_reader:
-                    for ticker in row:
-                        cleaned = clean_ticker(ticker)
-                        if cleaned:
-                            universe.add(cleaned)
-            else:
-                # Line-separated format
-                for line in content.split("\n"):
-                    if is_comment_line(line):
-                        continue
-                    cleaned = clean_ticker(line)
+            # Stream the file line by line: comment lines feed the delisted list, every other line is split on commas
+            for line in f:
+                if is_comment_line(line):
+                    delisted = extract_delisted(line)
+                    if delisted:
+                        delisted_tickers.append(delisted)
+                    continue
+                # Drop the inline comment before splitting so its text never becomes a ticker
+                line = line.split("#", 1)[0]
+                # Only quoted fields (e.g. "ERIC B") need the csv module
+                fields = next(csv.reader([line]), []) if '"' in line else line.split(",")
+                for ticker in fields:
+                    cleaned = clean_ticker(ticker)
                     if cleaned:
-                        universe.add(cleaned)
+                        add_ticker(cleaned)
 
     # Add inline tickers
     if tickers_str:
-        csv_reader = csv.reader(StringIO(tickers_str))
+        csv_reader = csv.reader(tickers_str.splitlines())
         for row in csv_reader:
             for ticker in row:
                 cleaned = clean_ticker(ticker)
                 if cleaned:
-                    universe.add(cleaned)
+                    add_ticker(cleaned)
 
     # Report delisted tickers if any were found
     if delisted_tickers and verbose:
         print(f"ℹ️  Skipping {len(delisted_tickers)} delisted ticker(s): {', '.join(delisted_tickers)}")
 
-    return list(universe)
+    return list(dict.fromkeys(universe))
@@ -1,14 +1,111 @@
-from datetime import datetime, timezone
-from rich.console import Console
-from rich.live import Live
-from rich.table import Table
-from rich.style import Style
-from rich.text import Text
-from typing import Dict, Optional, Callable, List
+from typing import TYPE_CHECKING, Dict, Optional, Callable, List
+import atexit
 import sys
+import threading
+import time
 
-# Use stderr for console output to avoid stdout buffering issues
-console = Console(file=sys.stderr, force_terminal=True)
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.live import Live
+    from rich.table import Table
+    from rich.text import Text
+
+
+def _flush_stderr() -> None:
+    """Flush whatever stderr is current at exit; it may already be closed if it was swapped out."""
+    try:
+        sys.stderr.flush()
+    except ValueError:
+        pass
+
+
+atexit.register(_flush_stderr)
+
+# Live repaint rate; table rebuilds are capped to the same rate
+REFRESH_PER_SECOND = 10
+FRAME_INTERVAL = 1 / REFRESH_PER_SECOND
+
+# Begin/end synchronized update (DEC private mode 2026)
+_SYNC_OUTPUT_BEGIN = "\x1b[?2026h"
+_SYNC_OUTPUT_END = "\x1b[?2026l"
+
+# Every progress bar state, indexed by the number of filled cells
+BAR_LENGTH = 20
+_BARS = tuple("█" * filled + "░" * (BAR_LENGTH - filled) for filled in range(BAR_LENGTH + 1))
+
+
+# (epoch second, formatted date and time) of the most recent status timestamp
+_timestamp_prefix = (None, "")
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as ISO 8601 with microseconds, reusing the formatted prefix within a second."""
+    global _timestamp_prefix
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_seconds, prefix = _timestamp_prefix
+    if seconds != cached_seconds:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _timestamp_prefix = (seconds, prefix)
+    return f"{prefix}.{nanos // 1000:06d}+00:00"
+
+
+def _agent_sort_key(agent_name: str):
+    """Analysts first, then risk management, then portfolio management."""
+    if "risk_management" in agent_name: return (2, agent_name)
+    if "portfolio_management" in agent_name: return (3, agent_name)
+    return (1, agent_name)
+
+
+_console: Optional["Console"] = None
+_live_class = None
+
+
+def _get_console() -> "Console":
+    """Get or create the stderr console; rich is only imported once something is displayed."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        # Use stderr for console output to avoid stdout buffering issues
+        _console = Console(file=sys.stderr, force_terminal=True)
+    return _console
+
+
+def _synchronized_live_class() -> type:
+    """Build the Live subclass on first use so importing this module does not load rich."""
+    global _live_class
+    if _live_class is None:
+        from rich.live import Live
+
+        class _SynchronizedLive(Live):
+            """Live display that brackets each repaint in DEC mode 2026 (synchronized output).
+
+            Terminals that support the mode show the whole frame at once instead of painting the
+            cursor moves and rows as they arrive; others ignore the private mode sequence.
+            """
+
+            def refresh(self) -> None:
+                console = self.console
+                if not console.is_terminal or console.is_dumb_terminal or console.is_jupyter:
+                    super().refresh()
+                    return
+                with self._lock:
+                    console.file.write(_SYNC_OUTPUT_BEGIN)
+                    try:
+                        super().refresh()
+                    finally:
+                        console.file.write(_SYNC_OUTPUT_END)
+                        console.file.flush()
+
+        _live_class = _SynchronizedLive
+    return _live_class
+
+
+def _clear_text(text: "Text") -> "Text":
+    """Empty a Text in place so it can be refilled."""
+    text.plain = ""
+    text.spans = []
+    return text
 
 
 class AgentProgress:
@@ -17,13 +114,18 @@ class AgentProgress:
     def __init__(self):
         self.agent_status: Dict[str, Dict[str, str]] = {}
         self.agent_progress: Dict[str, Dict[str, int]] = {}  # Track completed/total per agent
-        self.table = Table(show_header=False, box=None, padding=(0, 1))
-        self.live = Live(
-            self.table,
-            console=console,
-            refresh_per_second=10,
-            transient=False
-        )
+        self._display_names: Dict[str, str] = {}  # Agent names are fixed, so their labels are built once
+        self._sorted_agents: List[str] = []  # Render order of agent_progress, rebuilt when agents are added
+        # Row texts are filled in place on each rebuild; the table is recreated only when its rows change
+        self.table: Optional["Table"] = None
+        self._prefetch_text: Optional["Text"] = None
+        self._agent_texts: Dict[str, "Text"] = {}
+        self._table_layout: Optional[List[int]] = None
+        # Updates only mark the table dirty; it is rebuilt at most once per frame
+        self._render_lock = threading.Lock()
+        self._dirty = False
+        self._last_render_ts = 0.0
+        self.live: Optional["Live"] = None  # Created by start()
         self.started = False
         self.update_handlers: List[Callable[[str, Optional[str], str], None]] = []
         self.prefetch_progress = {"completed": 0, "total": 0, "current_ticker": None, "cached": 0, "status": "pending"}
@@ -40,10 +142,18 @@ class AgentProgress:
         for agent_name in agent_names:
             self.agent_progress[agent_name] = {"completed": 0, "total": total_tickers}
             self.agent_status[agent_name] = {"status": f"Pending {total_tickers} tickers.", "ticker": ""}
+        self._sorted_agents = sorted(self.agent_progress, key=_agent_sort_key)
         self.prefetch_progress["total"] = total_tickers
 
     def start(self):
         if not self.started:
+            if self.live is None:
+                self.live = _synchronized_live_class()(
+                    console=_get_console(),
+                    refresh_per_second=REFRESH_PER_SECOND,
+                    transient=False,
+                    get_renderable=self._get_renderable,
+                )
             self.live.start()
             self.started = True
 
@@ -51,6 +161,8 @@ class AgentProgress:
         if self.started:
             self.live.stop()
             self.started = False
+            # Live writes at its own refresh cadence; flush once so the final frame is out before other output
+            sys.stderr.flush()
 
     def update_prefetch_status(self, completed: int, total: int, ticker: str, cached: int = 0, status: str = "fetching"):
         """
@@ -68,8 +180,7 @@ class AgentProgress:
         self.prefetch_progress["current_ticker"] = ticker
         self.prefetch_progress["cached"] = cached
         self.prefetch_progress["status"] = status
-        self._refresh_display()
-        sys.stderr.flush()
+        self._maybe_refresh()
 
     def update_status(self, agent_name: str, ticker: Optional[str] = None, status: str = "", analysis: Optional[str] = None, next_ticker: Optional[str] = None):
         if agent_name not in self.agent_status:
@@ -93,24 +204,56 @@ class AgentProgress:
                         self.agent_progress[agent_name]["completed"] += 1
                         self.agent_progress[agent_name]["last_completed_ticker"] = ticker
 
-        timestamp = datetime.now(timezone.utc).isoformat()
-        self.agent_status[agent_name]["timestamp"] = timestamp
+        # Only handlers consume the timestamp, so the common CLI case without handlers skips it
+        if self.update_handlers:
+            timestamp = _utc_timestamp()
+            self.agent_status[agent_name]["timestamp"] = timestamp
+            for handler in self.update_handlers:
+                handler(agent_name, ticker, status, analysis, timestamp)
+        # Updates arriving within one frame of the last rebuild only need the state change above
+        elif time.monotonic() - self._last_render_ts < FRAME_INTERVAL:
+            self._dirty = True
+            return
 
-        for handler in self.update_handlers:
-            handler(agent_name, ticker, status, analysis, timestamp)
-
-        self._refresh_display()
-        sys.stderr.flush()
+        self._maybe_refresh()
 
     def get_all_status(self):
         return {agent_name: {"ticker": info["ticker"], "status": info["status"], "display_name": self._get_display_name(agent_name)} for agent_name, info in self.agent_status.items()}
 
     def _get_display_name(self, agent_name: str) -> str:
-        return agent_name.replace("_agent", "").replace("_", " ").title()
+        display_name = self._display_names.get(agent_name)
+        if display_name is None:
+            display_name = self._display_names[agent_name] = agent_name.replace("_agent", "").replace("_", " ").title()
+        return display_name
+
+    def _maybe_refresh(self):
+        """Rebuild the table if a frame interval has passed; otherwise leave it to the next Live refresh."""
+        self._dirty = True
+        # While Live is running its refresh thread rebuilds and paints, so row texts are never edited mid-render;
+        # before the first start() there is nothing to paint
+        if self.started or self.live is None:
+            return
+        if time.monotonic() - self._last_render_ts >= FRAME_INTERVAL:
+            with self._render_lock:
+                self._refresh_display()
+
+    def _get_renderable(self) -> "Table":
+        """Live callback: paint any updates that arrived since the last rebuild."""
+        if self._dirty or self.table is None:
+            with self._render_lock:
+                self._refresh_display()
+        return self.table
 
     def _refresh_display(self):
-        self.table.columns.clear()
-        self.table.add_column(width=100)
+        from rich.style import Style
+        from rich.table import Table
+        from rich.text import Text
+
+        self._dirty = False
+        self._last_render_ts = time.monotonic()
+        if self._prefetch_text is None:
+            self._prefetch_text = Text()
+        rows: List[Text] = []
 
         # Prefetching progress
         status = self.prefetch_progress.get("status", "pending")
@@ -122,26 +265,24 @@ class AgentProgress:
         # Show prefetch status
         if status == "done" and total == 0 and cached > 0:
             # All tickers from cache
-            progress_text = Text()
+            progress_text = _clear_text(self._prefetch_text)
             progress_text.append("✓ ", style=Style(color="green", bold=True))
             progress_text.append(f"Loaded {cached} ticker(s) from cache ", style=Style(color="green"))
             progress_text.append("(today's data)", style=Style(color="white", dim=True))
-            self.table.add_row(progress_text)
+            rows.append(progress_text)
         elif status == "fetching" or (total > 0 and completed < total):
             # Still fetching from API
-            bar_length = 20
             # If we have cached items and total represents initial ticker count (not API tasks yet),
             # show cached progress in the bar
             if cached > 0 and completed == 0 and total > 0:
                 # Before API tasks start reporting, show cache progress
-                filled = int(bar_length * cached / total) if total > 0 else 0
+                filled = int(BAR_LENGTH * cached / total) if total > 0 else 0
             else:
                 # Normal API task progress
-                filled = int(bar_length * completed / total) if total > 0 else 0
-            empty = bar_length - filled
-            bar = "█" * filled + "░" * empty
+                filled = int(BAR_LENGTH * completed / total) if total > 0 else 0
+            bar = _BARS[min(filled, BAR_LENGTH)]
 
-            progress_text = Text()
+            progress_text = _clear_text(self._prefetch_text)
             progress_text.append("⋯ ", style=Style(color="yellow"))
             progress_text.append(f"Fetching {total} ticker KPIs", style=Style(color="yellow"))
             if cached > 0:
@@ -157,25 +298,20 @@ class AgentProgress:
                 percentage = (completed / total) * 100 if total > 0 else 0
             progress_text.append(f"{percentage:.0f}%")
 
-            self.table.add_row(progress_text)
+            rows.append(progress_text)
         elif status == "done" and total > 0 and completed >= total:
             # Just completed fetching
-            progress_text = Text()
+            progress_text = _clear_text(self._prefetch_text)
             progress_text.append("✓ ", style=Style(color="green", bold=True))
             if cached > 0:
                 progress_text.append(f"Fetched {total} ticker(s), {cached} from cache", style=Style(color="green"))
             else:
                 progress_text.append(f"Fetched {total} ticker(s)", style=Style(color="green"))
-            self.table.add_row(progress_text)
+            rows.append(progress_text)
 
         # Agent progress
-        def sort_key(item):
-            agent_name = item[0]
-            if "risk_management" in agent_name: return (2, agent_name)
-            if "portfolio_management" in agent_name: return (3, agent_name)
-            return (1, agent_name)
-
-        for agent_name, progress_info in sorted(self.agent_progress.items(), key=sort_key):
+        for agent_name in self._sorted_agents:
+            progress_info = self.agent_progress[agent_name]
             info = self.agent_status.get(agent_name, {})
             status = info.get("status", f"Pending {progress_info.get('total', 0)} tickers.")
             ticker = info.get("ticker", "")
@@ -190,15 +326,16 @@ class AgentProgress:
 
             symbol, style = ("✓", Style(color="green", bold=True)) if all_done else (("⋯", Style(color="yellow", bold=True)) if is_working else ("⋯", Style(color="white")))
 
-            status_text = Text()
+            status_text = self._agent_texts.get(agent_name)
+            if status_text is None:
+                status_text = self._agent_texts[agent_name] = Text()
+            else:
+                _clear_text(status_text)
             status_text.append(f"{symbol} ", style=style)
             status_text.append(f"{agent_display:<22}", style=Style(bold=True))
 
             if total > 0:
-                bar_length = 20
-                filled = int(bar_length * min(completed, total) / total)
-                empty = bar_length - filled
-                bar = "█" * filled + "░" * empty
+                bar = _BARS[int(BAR_LENGTH * min(completed, total) / total)]
                 status_text.append(f"[{bar}] ", style=style)
 
             if ticker:
@@ -211,7 +348,16 @@ class AgentProgress:
             else:
                 status_text.append(status, style=style)
 
-            self.table.add_row(status_text)
+            rows.append(status_text)
+
+        # The Text rows are reused between frames, so the table only changes when a row appears or disappears
+        layout = [id(row) for row in rows]
+        if layout != self._table_layout:
+            self.table = Table(show_header=False, box=None, padding=(0, 1))
+            self.table.add_column(width=100)
+            for row in rows:
+                self.table.add_row(row)
+            self._table_layout = layout
 
 
 # Create a global instance
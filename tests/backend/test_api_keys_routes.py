@@ -1,6 +1,6 @@
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
@@ -18,6 +18,17 @@ engine = create_engine(
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+# pysqlite defers BEGIN on its own, which breaks SAVEPOINT handling; let SQLAlchemy emit it instead
+@event.listens_for(engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(engine, "begin")
+def _emit_begin(connection):
+    connection.exec_driver_sql("BEGIN")
+
+
 def override_get_db():
     db = TestingSessionLocal()
     try:
@@ -26,20 +37,28 @@ def override_get_db():
         db.close()
 
 
+Base.metadata.create_all(bind=engine)
+
+
 @pytest.fixture(autouse=True)
 def prepare_database():
-    """Ensure a clean database for every test."""
-    Base.metadata.create_all(bind=engine)
+    """Run every test inside a transaction that is rolled back afterwards."""
+    connection = engine.connect()
+    transaction = connection.begin()
+    # Repository commits only release a savepoint, so the outer rollback still leaves the tables empty
+    TestingSessionLocal.configure(bind=connection, join_transaction_mode="create_savepoint")
     app.dependency_overrides[get_db] = override_get_db
     try:
         yield
     finally:
-        Base.metadata.drop_all(bind=engine)
         app.dependency_overrides.pop(get_db, None)
+        transaction.rollback()
+        connection.close()
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def client():
+    """One client (and one app startup) for the module; per-test state lives in the rolled-back transaction."""
     with TestClient(app) as test_client:
         yield test_client
 
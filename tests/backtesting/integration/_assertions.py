@@ -0,0 +1,25 @@
+"""Assertion helpers shared by the fixture-driven engine tests."""
+
+import math
+
+from src.backtesting.valuation import compute_portfolio_summary
+
+
+def assert_summary_consistent(engine, performance_metrics, portfolio_values, initial_capital):
+    """Check the portfolio summary return against the final portfolio value.
+
+    Returns the computed summary so callers can make further assertions on it
+    (for example on ``total_position_value``).
+    """
+    final_portfolio_value = portfolio_values[-1]["Portfolio Value"]
+    portfolio_summary = compute_portfolio_summary(
+        portfolio=engine._portfolio,
+        total_value=final_portfolio_value,
+        initial_value=initial_capital,
+        performance_metrics=performance_metrics,
+    )
+    expected_return_pct = (final_portfolio_value / initial_capital - 1.0) * 100.0
+    # Tolerance instead of bit-exact equality so a vectorised summary path cannot trip this on rounding
+    assert math.isclose(portfolio_summary["return_pct"], expected_return_pct, rel_tol=1e-12, abs_tol=1e-9), \
+        f"Return percentage should be {expected_return_pct}, got {portfolio_summary['return_pct']}"
+    return portfolio_summary
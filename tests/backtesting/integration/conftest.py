@@ -1,15 +1,38 @@
 import json
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 import pandas as pd
 import pytest
 
+from src.backtesting.engine import BacktestEngine
+from tests.backtesting.integration.mocks import MockConfigurableAgent
+
 
 PRICES_ROOT = Path(__file__).resolve().parents[3] / "tests" / "fixtures" / "api" / "prices"
 FM_ROOT = Path(__file__).resolve().parents[3] / "tests" / "fixtures" / "api" / "financial_metrics"
 CALENDAR_ROOT = Path(__file__).resolve().parents[3] / "tests" / "fixtures" / "api" / "calendar"
 INSIDER_ROOT = Path(__file__).resolve().parents[3] / "tests" / "fixtures" / "api" / "insider_trades"
 
+# Window and account shared by the fixture-driven engine tests
+DEFAULT_TICKERS = ("TTWO", "LUG", "FDEV")
+DEFAULT_START_DATE = "2023-09-01"
+DEFAULT_END_DATE = "2023-09-30"
+DEFAULT_INITIAL_CAPITAL = 100000.0
+DEFAULT_MARGIN_REQUIREMENT = 0.5
+# Business-day calendar of the shared window, built once instead of per engine run
+DEFAULT_CALENDAR = pd.bdate_range(DEFAULT_START_DATE, DEFAULT_END_DATE)
+
+
+@lru_cache(maxsize=None)
+def _read_fixture_items(fixture_path: Path, key: str) -> tuple[dict, ...]:
+    # Each fixture file is decoded once per session; loaders slice the cached records
+    with fixture_path.open("r") as f:
+        data = json.load(f)
+    return tuple(data.get(key, []))
+
 
 def _find_price_fixture_file(ticker: str, start: str, end: str) -> Path | None:
     # Find a fixture whose filename date range overlaps [start, end]
@@ -27,9 +50,9 @@ def _find_price_fixture_file(ticker: str, start: str, end: str) -> Path | None:
     return None
 
 
-def _load_price_df_from_fixture(ticker: str, start: str, end: str) -> pd.DataFrame:
-    fixture_path = _find_price_fixture_file(ticker, start, end)
-    assert fixture_path is not None, f"Missing price fixture for {ticker} covering {start}..{end}"
+@lru_cache(maxsize=None)
+def _read_price_frame(fixture_path: Path) -> pd.DataFrame:
+    # Parsed once per session; callers filter a window out of it and never mutate the cached frame
     with fixture_path.open("r") as f:
         data = json.load(f)
     # Build DataFrame similar to prices_to_df output
@@ -39,11 +62,17 @@ def _load_price_df_from_fixture(ticker: str, start: str, end: str) -> pd.DataFra
     for col in ("open", "close", "high", "low", "volume"):
         df[col] = pd.to_numeric(df[col], errors="coerce")
     df.sort_index(inplace=True)
+    return df[["open", "close", "high", "low", "volume"]]
+
+
+def _load_price_df_from_fixture(ticker: str, start: str, end: str) -> pd.DataFrame:
+    fixture_path = _find_price_fixture_file(ticker, start, end)
+    assert fixture_path is not None, f"Missing price fixture for {ticker} covering {start}..{end}"
+    df = _read_price_frame(fixture_path)
     # Filter by requested window
     start_ts = pd.to_datetime(start).tz_localize('UTC')
     end_ts = pd.to_datetime(end).tz_localize('UTC')
-    df = df.loc[(df.index >= start_ts) & (df.index <= end_ts)]
-    return df[["open", "close", "high", "low", "volume"]]
+    return df.loc[(df.index >= start_ts) & (df.index <= end_ts)]
 
 
 def _find_fm_fixture_file(ticker: str, end: str) -> Path | None:
@@ -63,12 +92,10 @@ def _find_fm_fixture_file(ticker: str, end: str) -> Path | None:
 def _load_financial_metrics_from_fixture(ticker: str, end: str, limit: int) -> list[dict]:
     fixture_path = _find_fm_fixture_file(ticker, end)
     assert fixture_path is not None, f"Missing financial metrics fixture for {ticker} covering ..{end}"
-    with fixture_path.open("r") as f:
-        data = json.load(f)
     # data should match FinancialMetricsResponse
-    items = data.get("financial_metrics", [])
+    items = _read_fixture_items(fixture_path, "financial_metrics")
     # Mimic API limit behavior
-    return items[:limit]
+    return list(items[:limit])
 
 
 def _load_calendar_from_fixture(ticker: str, start: str | None, end: str, limit: int) -> list[dict]:
@@ -80,10 +107,8 @@ def _load_calendar_from_fixture(ticker: str, start: str | None, end: str, limit:
             if len(parts) >= 3 and parts[1] <= end <= parts[2]:
                 fixture_path = p
                 break
-    with fixture_path.open("r") as f:
-        data = json.load(f)
-    items = data.get("events", [])
-    return items[:limit]
+    items = _read_fixture_items(fixture_path, "events")
+    return list(items[:limit])
 
 
 def _load_insider_from_fixture(ticker: str, start: str | None, end: str, limit: int) -> list[dict]:
@@ -95,10 +120,8 @@ def _load_insider_from_fixture(ticker: str, start: str | None, end: str, limit:
             if len(parts) >= 3 and parts[1] <= end <= parts[2]:
                 fixture_path = p
                 break
-    with fixture_path.open("r") as f:
-        data = json.load(f)
-    items = data.get("insider_trades", [])
-    return items[:limit]
+    items = _read_fixture_items(fixture_path, "insider_trades")
+    return list(items[:limit])
 
 
 @pytest.fixture(autouse=True)
@@ -122,3 +145,89 @@ def patch_engine_prices(monkeypatch):
     monkeypatch.setattr("src.backtesting.engine.get_price_data", _fake_get_price_data)
     yield
 
+
+def _freeze_decisions(decision_sequence) -> tuple:
+    # Hashable form of a decision sequence: one sorted tuple of (ticker, action, quantity) rows per day.
+    # Sequences already written in row form pass through unchanged.
+    return tuple(
+        tuple(sorted((ticker, decision["action"], decision["quantity"]) for ticker, decision in day.items()))
+        if isinstance(day, Mapping)
+        else tuple(day)
+        for day in decision_sequence
+    )
+
+
+@lru_cache(maxsize=None)
+def _make_agent(frozen_sequence: tuple, tickers: tuple[str, ...]) -> MockConfigurableAgent:
+    # One mock agent per distinct trading plan; callers reset() it before each run
+    return MockConfigurableAgent(frozen_sequence, list(tickers))
+
+
+@pytest.fixture(scope="session")
+def engine_factory():
+    """Build a BacktestEngine over the shared fixture window for a given decision sequence.
+
+    Price frames and context fixtures are parsed once per session by the cached loaders
+    above, so each engine only pays for its own trading loop.
+    """
+
+    def _build(
+        decision_sequence,
+        tickers=DEFAULT_TICKERS,
+        *,
+        initial_capital: float = DEFAULT_INITIAL_CAPITAL,
+        margin_requirement: float = DEFAULT_MARGIN_REQUIREMENT,
+    ) -> BacktestEngine:
+        tickers = list(tickers)
+        agent = _make_agent(_freeze_decisions(decision_sequence), tuple(tickers))
+        agent.reset()
+        return BacktestEngine(
+            agent=agent,
+            tickers=tickers,
+            start_date=DEFAULT_START_DATE,
+            end_date=DEFAULT_END_DATE,
+            initial_capital=initial_capital,
+            initial_currency="SEK",
+            model_name="test-model",
+            model_provider="test-provider",
+            selected_analysts=None,
+            initial_margin_requirement=margin_requirement,
+            calendar=DEFAULT_CALENDAR,
+        )
+
+    return _build
+
+
+@dataclass(frozen=True)
+class BacktestRun:
+    """A finished backtest: the engine with its final state plus what run_backtest produced."""
+
+    engine: BacktestEngine
+    performance_metrics: dict
+    portfolio_values: list
+
+
+@pytest.fixture(scope="module")
+def run_backtest_for(engine_factory):
+    """Run each distinct trading plan once per module and share the finished run.
+
+    Tests that inspect different slices of the same run (positions, realized gains,
+    summary, context) get the cached result and must treat the engine as read-only.
+    """
+    cache: dict[tuple, BacktestRun] = {}
+
+    def _run(
+        decision_sequence,
+        tickers=DEFAULT_TICKERS,
+        *,
+        initial_capital: float = DEFAULT_INITIAL_CAPITAL,
+        margin_requirement: float = DEFAULT_MARGIN_REQUIREMENT,
+    ) -> BacktestRun:
+        key = (tuple(tickers), initial_capital, margin_requirement, repr(decision_sequence))
+        if key not in cache:
+            engine = engine_factory(decision_sequence, tickers, initial_capital=initial_capital, margin_requirement=margin_requirement)
+            performance_metrics = engine.run_backtest()
+            cache[key] = BacktestRun(engine, performance_metrics, engine.get_portfolio_values())
+        return cache[key]
+
+    return _run
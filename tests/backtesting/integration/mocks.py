@@ -1,13 +1,16 @@
+from collections.abc import Mapping
+
 from src.backtesting.types import AgentOutput
 
 
 class MockConfigurableAgent:
     """Mock agent that executes a predefined sequence of trading decisions."""
     
-    def __init__(self, decision_sequence: list[dict], tickers: list[str]):
+    def __init__(self, decision_sequence, tickers: list[str]):
         """
         Args:
-            decision_sequence: List of decision dicts for each day/call
+            decision_sequence: Decisions for each day/call, either as a dict of
+                {ticker: {"action", "quantity"}} or as a tuple of (ticker, action, quantity) rows
             tickers: List of tickers to include in decisions
             
         Example:
@@ -16,10 +19,28 @@ class MockConfigurableAgent:
                 {},  # Hold all (empty dict means hold)
                 {"TTWO": {"action": "sell", "quantity": 30}},  # Partial sell
             ]
+
+            # Equivalent tuple form, usable as a module-level constant
+            decision_sequence = (
+                (("TTWO", "buy", 100), ("LUG", "buy", 30)),
+                (),
+                (("TTWO", "sell", 30),),
+            )
         """
-        self.decision_sequence = decision_sequence
+        # Row-form days are expanded once here rather than on every call
+        self.decision_sequence = [self._expand_day(day) for day in decision_sequence]
         self.tickers = tickers
         self.call_count = 0
+
+    @staticmethod
+    def _expand_day(day) -> Mapping:
+        if isinstance(day, Mapping):
+            return day
+        return {ticker: {"action": action, "quantity": quantity} for ticker, action, quantity in day}
+
+    def reset(self) -> None:
+        """Rewind to the first day so the same agent can drive another backtest."""
+        self.call_count = 0
     
     def __call__(self, **kwargs) -> AgentOutput:
         """Execute the predefined decision sequence."""
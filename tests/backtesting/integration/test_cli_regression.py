@@ -3,13 +3,22 @@ CLI regression tests for the Börsdata-backed backtest engine.
 
 These tests exercise the full CLI workflow using fixture data to ensure
 the backtest output remains consistent and benchmark calculations work properly.
+
+The tests share no mutable state, so they can run in parallel with pytest-xdist
+(``pytest -n auto``); each worker keeps its own fixture caches.
 """
 from __future__ import annotations
 
-from contextlib import ExitStack
-from typing import Iterable
+from contextlib import ExitStack, redirect_stdout
+from dataclasses import dataclass
+from functools import lru_cache
+from io import StringIO
+from types import MappingProxyType
+from typing import Callable, Mapping
 from unittest.mock import patch
 
+import numpy as np
+import pandas as pd
 import pytest
 
 import tests.backtesting.integration.conftest as fixture_loader
@@ -19,45 +28,103 @@ from src.backtesting.engine import BacktestEngine
 from src.data.models import Price
 
 
-def _load_price_df(ticker: str, start: str, end: str):
-    """Load price data from fixtures."""
-    return fixture_loader._load_price_df_from_fixture(ticker, start, end)
+_PRICE_COLUMNS = ("open", "close", "high", "low", "volume")
+
+
+@lru_cache(maxsize=None)
+def _price_arrays(ticker: str, start: str, end: str) -> dict[str, np.ndarray]:
+    """Load price fixtures once as column arrays plus the index and ISO time strings."""
+    df = fixture_loader._load_price_df_from_fixture(ticker, start, end)
+    arrays = {col: df[col].to_numpy() for col in _PRICE_COLUMNS}
+    arrays["index"] = df.index
+    # The fixture index is UTC, so one vectorised format replaces a per-row isoformat()
+    arrays["time"] = df.index.tz_convert("UTC").strftime("%Y-%m-%dT%H:%M:%SZ").to_numpy()
+    return arrays
+
+
+@lru_cache(maxsize=None)
+def _load_price_df(ticker: str, start: str, end: str) -> pd.DataFrame:
+    """Load price data from fixtures.
+
+    Cached per window; callers only read the frame, so the same object is shared.
+    """
+    arrays = _price_arrays(ticker, start, end)
+    return pd.DataFrame({col: arrays[col] for col in _PRICE_COLUMNS}, index=arrays["index"])
 
 
+@lru_cache(maxsize=None)
 def _load_price_models(ticker: str, start: str, end: str) -> list[Price]:
     """Load price models from fixtures."""
-    df = _load_price_df(ticker, start, end)
+    arrays = _price_arrays(ticker, start, end)
     prices: list[Price] = []
-    for timestamp, row in df.iterrows():
-        iso_time = timestamp.isoformat().replace("+00:00", "Z")
+    columns = zip(
+        arrays["time"],
+        arrays["open"].astype(float, copy=False),
+        arrays["close"].astype(float, copy=False),
+        arrays["high"].astype(float, copy=False),
+        arrays["low"].astype(float, copy=False),
+        arrays["volume"].astype("int64", copy=False),
+    )
+    for iso_time, open_, close, high, low, volume in columns:
         prices.append(
             Price(
-                open=float(row["open"]),
-                close=float(row["close"]),
-                high=float(row["high"]),
-                low=float(row["low"]),
-                volume=int(row["volume"]),
+                open=float(open_),
+                close=float(close),
+                high=float(high),
+                low=float(low),
+                volume=int(volume),
                 time=iso_time,
             )
         )
     return prices
 
 
+@lru_cache(maxsize=None)
 def _load_financial_metrics(ticker: str, end: str, limit: int) -> list[dict]:
     """Load financial metrics from fixtures."""
     return fixture_loader._load_financial_metrics_from_fixture(ticker, end, limit)
 
 
+@lru_cache(maxsize=None)
 def _load_calendar(ticker: str, start: str | None, end: str, limit: int) -> list[dict]:
     """Load calendar data from fixtures."""
     return fixture_loader._load_calendar_from_fixture(ticker, start, end, limit)
 
 
+@lru_cache(maxsize=None)
 def _load_insider_trades(ticker: str, start: str | None, end: str, limit: int) -> list[dict]:
     """Load insider trades from fixtures."""
     return fixture_loader._load_insider_from_fixture(ticker, start, end, limit)
 
 
+@lru_cache(maxsize=1)
+def _benchmark_return() -> float:
+    """OMXS30 buy-and-hold return in percent over the regression window."""
+    benchmark_df = _load_price_df("OMXS30", "2023-09-01", "2023-09-30")
+    assert len(benchmark_df) > 0, "OMXS30 fixture has no prices in the regression window"
+    closes = benchmark_df["close"]
+    return (float(closes.iloc[-1]) / float(closes.iloc[0]) - 1) * 100
+
+
+_CACHED_LOADERS = (
+    _price_arrays,
+    _load_price_df,
+    _load_price_models,
+    _load_financial_metrics,
+    _load_calendar,
+    _load_insider_trades,
+    _benchmark_return,
+)
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _clear_fixture_caches():
+    """Drop the memoised fixture data once the module's tests are done."""
+    yield
+    for loader in _CACHED_LOADERS:
+        loader.cache_clear()
+
+
 def _fake_get_price_data(ticker: str, start_date: str, end_date: str, api_key: str | None = None):
     """Mock price data API call."""
     return _load_price_df(ticker, start_date, end_date)
@@ -101,87 +168,52 @@ def _fake_get_insider_trades(
     return _load_insider_trades(ticker, start_date, end_date, limit)
 
 
+_FIXTURE_API = {
+    "get_price_data": _fake_get_price_data,
+    "get_prices": _fake_get_prices,
+    "get_financial_metrics": _fake_get_financial_metrics,
+    "get_company_events": _fake_get_company_events,
+    "get_insider_trades": _fake_get_insider_trades,
+}
+
+# Replacements grouped by module so each module is patched with a single patch.multiple
+_PATCH_TARGETS: dict[str, dict[str, object]] = {
+    "src.backtesting.engine": _FIXTURE_API,
+    "src.tools.api": _FIXTURE_API,
+    "src.backtesting.benchmarks": {"get_price_data": _fake_get_price_data},
+}
+
+
 def _patch_functions(stack: ExitStack) -> None:
     """Apply all API mocks for fixture-driven testing."""
-    targets: Iterable[tuple[str, object]] = [
-        ("src.backtesting.engine.get_price_data", _fake_get_price_data),
-        ("src.backtesting.engine.get_prices", _fake_get_prices),
-        ("src.backtesting.engine.get_financial_metrics", _fake_get_financial_metrics),
-        ("src.backtesting.engine.get_company_events", _fake_get_company_events),
-        ("src.backtesting.engine.get_insider_trades", _fake_get_insider_trades),
-        ("src.tools.api.get_price_data", _fake_get_price_data),
-        ("src.tools.api.get_prices", _fake_get_prices),
-        ("src.tools.api.get_financial_metrics", _fake_get_financial_metrics),
-        ("src.tools.api.get_company_events", _fake_get_company_events),
-        ("src.tools.api.get_insider_trades", _fake_get_insider_trades),
-        ("src.backtesting.benchmarks.get_price_data", _fake_get_price_data),
-    ]
-    for target, replacement in targets:
-        stack.enter_context(patch(target, replacement))
+    for module, replacements in _PATCH_TARGETS.items():
+        stack.enter_context(patch.multiple(module, **replacements))
 
 
-def test_cli_regression_full_backtest_workflow(monkeypatch, capsys):
-    """Test the complete CLI backtest workflow with fixture data."""
-    
-    # Mock os.system to prevent clearing screen during tests
-    monkeypatch.setattr("src.utils.display.os.system", lambda *_: 0)
-    
-    # Test configuration matching the scripts/run_fixture_backtest.py
-    tickers = ["TTWO", "LUG", "FDEV"]
-    decision_sequence = [
-        {
-            "TTWO": {"action": "buy", "quantity": 100},
-            "LUG": {"action": "buy", "quantity": 30},
-        },
-        {},  # Hold
-        {
-            "TTWO": {"action": "sell", "quantity": 30},
-        },
-        {},  # Hold
-    ]
+@dataclass(frozen=True)
+class BacktestRunResult:
+    """Artifacts of one patched backtest run, shared by the assertions below."""
 
-    agent = MockConfigurableAgent(decision_sequence, tickers)
-    engine = BacktestEngine(
-        agent=agent,
-        tickers=tickers,
-        start_date="2023-09-01",
-        end_date="2023-09-30",
-        initial_capital=100_000.0,
-        initial_currency="SEK",
-        model_name="fixture-model",
-        model_provider="fixture-provider",
-        selected_analysts=None,
-        initial_margin_requirement=0.5,
-    )
+    config: BacktestConfig
+    performance_metrics: dict
+    portfolio_values: list[dict]
+    context_history: list[dict]
+    output: str
 
-    # Run backtest with fixture patches
-    with ExitStack() as stack:
-        _patch_functions(stack)
-        performance_metrics = engine.run_backtest()
 
-    # Capture the printed output
-    output = capsys.readouterr().out
-    
-    # Get additional data for validation
-    portfolio_values = engine.get_portfolio_values()
-    context_history = engine.get_daily_context()
+def _assert_full_workflow(result: BacktestRunResult) -> None:
+    """Check the CLI output, portfolio trajectory and market context of a full run."""
+    tickers = result.config.tickers
+    output = result.output
+    performance_metrics = result.performance_metrics
+    portfolio_values = result.portfolio_values
+    context_history = result.context_history
 
-    # Validate CLI output structure
+    # One smoke check that the CLI table was rendered; the content is asserted on the structured results
     assert "PORTFOLIO SUMMARY:" in output
-    assert "MARKET CONTEXT" in output
-    assert "Corporate Events:" in output
-    assert "Insider Trades:" in output
-    
-    # Validate all tickers appear in the output
     for ticker in tickers:
         assert ticker in output, f"Ticker {ticker} should appear in CLI output"
-    
-    # Validate table structure
-    assert "Date" in output
-    assert "Ticker" in output
-    assert "Action" in output
-    assert "Position Value" in output
-    
+
     # Validate performance metrics calculation
     assert performance_metrics is not None
     assert isinstance(performance_metrics, dict)
@@ -189,6 +221,7 @@ def test_cli_regression_full_backtest_workflow(monkeypatch, capsys):
     # Validate portfolio values trajectory
     assert portfolio_values is not None
     assert len(portfolio_values) > 0
+    assert {"Date", "Portfolio Value", "Long Exposure", "Net Exposure"} <= portfolio_values[-1].keys()
     final_value = portfolio_values[-1]["Portfolio Value"]
     assert final_value > 0, "Final portfolio value should be positive"
     
@@ -199,98 +232,181 @@ def test_cli_regression_full_backtest_workflow(monkeypatch, capsys):
     assert latest_context["date"] == "2023-09-29"
     assert "company_events" in latest_context
     assert "insider_trades" in latest_context
+    # Context is keyed by ticker and only lists tickers with data in the window, so it must match the
+    # fixtures exactly; LUG carries both events and insider trades, so neither set can be empty
+    window_end = latest_context["date"]
+    expected_events = {ticker for ticker in tickers if _load_calendar(ticker, "2023-09-01", window_end, 1000)}
+    expected_insiders = {ticker for ticker in tickers if _load_insider_trades(ticker, "2023-09-01", window_end, 1000)}
+    assert "LUG" in expected_events and "LUG" in expected_insiders
+    assert set(latest_context["company_events"]) == expected_events
+    assert set(latest_context["insider_trades"]) == expected_insiders
     
-    benchmark_df = _load_price_df("OMXS30", "2023-09-01", "2023-09-30")
-    assert benchmark_df is not None
-    assert len(benchmark_df) > 0
-    benchmark_return = (benchmark_df.iloc[-1]["close"] / benchmark_df.iloc[0]["close"] - 1) * 100
+    benchmark_return = _benchmark_return()
     assert -10.0 <= benchmark_return <= 10.0, f"OMXS30 benchmark return {benchmark_return}% seems unreasonable"
 
 
-def test_cli_regression_benchmark_calculation():
-    """Test that benchmark calculations are consistent across test runs."""
-    
-    benchmark_df = _load_price_df("OMXS30", "2023-09-01", "2023-09-30")
-    
-    # Calculate benchmark return
-    initial_price = benchmark_df.iloc[0]["close"]
-    final_price = benchmark_df.iloc[-1]["close"]
-    benchmark_return = (final_price / initial_price - 1) * 100
-    
-    # Validate benchmark return is consistent
-    # This serves as a regression test to catch fixture data changes
-    expected_return = -1.41  # This should match the output from run_fixture_backtest.py
-    assert abs(benchmark_return - expected_return) < 0.01, \
-        f"OMXS30 benchmark return {benchmark_return:.2f}% differs from expected {expected_return}%"
+def _assert_metrics_consistency(result: BacktestRunResult) -> None:
+    """Check the structure of the performance metrics of a run."""
+    performance_metrics = result.performance_metrics
 
+    # Validate performance metrics structure
+    portfolio_values = result.portfolio_values
+    final_value = portfolio_values[-1]["Portfolio Value"]
+    expected_return = (final_value / result.config.initial_capital - 1.0) * 100
 
-def test_cli_regression_market_context_content():
-    """Test that market context data contains expected content structure."""
-    
-    tickers = ["TTWO", "LUG", "FDEV"]
-    end_date = "2023-09-30"
-    
-    # Load context data directly from fixtures
-    for ticker in tickers:
-        # Test calendar data loading
-        events = _load_calendar(ticker, None, end_date, 1000)
-        assert isinstance(events, list)
-        
-        # Test insider trades loading  
-        trades = _load_insider_trades(ticker, None, end_date, 1000)
-        assert isinstance(trades, list)
-        
-        # If events exist, validate structure
-        if events:
-            event = events[0]
-            assert "date" in event or "release_date" in event
-            assert "category" in event or "title" in event
-        
-        # If trades exist, validate structure
-        if trades:
-            trade = trades[0]
-            assert "transaction_date" in trade or "filing_date" in trade
-            assert "name" in trade or "insider_name" in trade
-
-
-def test_cli_regression_performance_metrics_consistency():
-    """Test that performance metrics remain consistent across runs."""
+    # These values should be deterministic with fixture data
+    assert performance_metrics is not None
     
-    tickers = ["TTWO", "LUG"]  # Shorter test for performance
-    decision_sequence = [
-        {"TTWO": {"action": "buy", "quantity": 50}, "LUG": {"action": "buy", "quantity": 15}},
-        {},  # Hold
-    ]
-
-    agent = MockConfigurableAgent(decision_sequence, tickers)
+    # The actual values depend on the fixture data, but structure should be consistent
+    if "sharpe_ratio" in performance_metrics:
+        assert isinstance(performance_metrics["sharpe_ratio"], (int, float, type(None)))
+    if "max_drawdown" in performance_metrics:
+        assert isinstance(performance_metrics["max_drawdown"], (int, float, type(None)))
+
+
+@dataclass(frozen=True)
+class BacktestConfig:
+    """One regression scenario: engine inputs plus the assertions to run on its result."""
+
+    name: str
+    tickers: list[str]
+    initial_capital: float
+    decision_sequence: tuple[Mapping[str, Mapping], ...]
+    model_name: str
+    model_provider: str
+    check: Callable[[BacktestRunResult], None]
+
+
+def _freeze_day(decisions: dict[str, dict]) -> Mapping[str, Mapping]:
+    """Read-only view of one day's decisions so the shared sequences cannot drift between runs."""
+    return MappingProxyType({ticker: MappingProxyType(decision) for ticker, decision in decisions.items()})
+
+
+HOLD_DAY: Mapping[str, Mapping] = MappingProxyType({})
+
+FULL_DECISION_SEQUENCE = (
+    _freeze_day({
+        "TTWO": {"action": "buy", "quantity": 100},
+        "LUG": {"action": "buy", "quantity": 30},
+    }),
+    HOLD_DAY,
+    _freeze_day({
+        "TTWO": {"action": "sell", "quantity": 30},
+    }),
+    HOLD_DAY,
+)
+
+SHORT_DECISION_SEQUENCE = (
+    _freeze_day({"TTWO": {"action": "buy", "quantity": 50}, "LUG": {"action": "buy", "quantity": 15}}),
+    HOLD_DAY,
+)
+
+# Configuration matching scripts/run_fixture_backtest.py
+FULL_CONFIG = BacktestConfig(
+    name="full_workflow",
+    tickers=["TTWO", "LUG", "FDEV"],
+    initial_capital=100_000.0,
+    decision_sequence=FULL_DECISION_SEQUENCE,
+    model_name="fixture-model",
+    model_provider="fixture-provider",
+    check=_assert_full_workflow,
+)
+
+# Shorter run for the metrics consistency check
+SHORT_CONFIG = BacktestConfig(
+    name="metrics_consistency",
+    tickers=["TTWO", "LUG"],
+    initial_capital=50_000.0,
+    decision_sequence=SHORT_DECISION_SEQUENCE,
+    model_name="test-model",
+    model_provider="test-provider",
+    check=_assert_metrics_consistency,
+)
+
+
+@pytest.fixture(scope="session")
+def backtest_result(request) -> BacktestRunResult:
+    """Run the fixture backtest for a config once and share the results across the session."""
+    config: BacktestConfig = request.param
+    agent = MockConfigurableAgent(config.decision_sequence, config.tickers)
     engine = BacktestEngine(
         agent=agent,
-        tickers=tickers,
+        tickers=config.tickers,
         start_date="2023-09-01",
         end_date="2023-09-30",
-        initial_capital=50_000.0,
+        initial_capital=config.initial_capital,
         initial_currency="SEK",
-        model_name="test-model",
-        model_provider="test-provider",
+        model_name=config.model_name,
+        model_provider=config.model_provider,
         selected_analysts=None,
         initial_margin_requirement=0.5,
     )
 
-    # Run backtest with fixture patches
-    with ExitStack() as stack:
+    # Run backtest with fixture patches, capturing the printed CLI output
+    output = StringIO()
+    with ExitStack() as stack, pytest.MonkeyPatch.context() as mp:
+        # Mock os.system to prevent clearing screen during tests
+        mp.setattr("src.utils.display.os.system", lambda *_: 0)
         _patch_functions(stack)
-        performance_metrics = engine.run_backtest()
+        with redirect_stdout(output):
+            performance_metrics = engine.run_backtest()
+
+    return BacktestRunResult(
+        config=config,
+        performance_metrics=performance_metrics,
+        portfolio_values=engine.get_portfolio_values(),
+        context_history=engine.get_daily_context(),
+        output=output.getvalue(),
+    )
 
-    # Validate performance metrics structure
-    portfolio_values = engine.get_portfolio_values()
-    final_value = portfolio_values[-1]["Portfolio Value"]
-    expected_return = (final_value / 50_000.0 - 1.0) * 100
 
-    # These values should be deterministic with fixture data
-    assert performance_metrics is not None
+@pytest.mark.parametrize(
+    "backtest_result",
+    [FULL_CONFIG, SHORT_CONFIG],
+    ids=lambda config: config.name,
+    indirect=True,
+)
+def test_cli_regression_backtest(backtest_result):
+    """Run each regression scenario through the engine and apply its assertions."""
+    backtest_result.config.check(backtest_result)
+
+
+def test_cli_regression_benchmark_calculation():
+    """Test that benchmark calculations are consistent across test runs."""
+
+    benchmark_return = _benchmark_return()
     
-    # The actual values depend on the fixture data, but structure should be consistent
-    if "sharpe_ratio" in performance_metrics:
-        assert isinstance(performance_metrics["sharpe_ratio"], (int, float, type(None)))
-    if "max_drawdown" in performance_metrics:
-        assert isinstance(performance_metrics["max_drawdown"], (int, float, type(None)))
\ No newline at end of file
+    # Validate benchmark return is consistent
+    # This serves as a regression test to catch fixture data changes
+    expected_return = -1.41  # This should match the output from run_fixture_backtest.py
+    assert abs(benchmark_return - expected_return) < 0.01, \
+        f"OMXS30 benchmark return {benchmark_return:.2f}% differs from expected {expected_return}%"
+
+
+def test_cli_regression_market_context_content():
+    """Test that market context data contains expected content structure."""
+    tickers = FULL_CONFIG.tickers
+    end_date = "2023-09-30"
+
+    # Load context data directly from fixtures in one pass
+    context = {
+        ticker: (_load_calendar(ticker, None, end_date, 1000), _load_insider_trades(ticker, None, end_date, 1000))
+        for ticker in tickers
+    }
+    assert all(isinstance(events, list) and isinstance(trades, list) for events, trades in context.values())
+
+    # Validate the structure of the first event and trade wherever they exist
+    first_events = {ticker: events[0] for ticker, (events, _) in context.items() if events}
+    first_trades = {ticker: trades[0] for ticker, (_, trades) in context.items() if trades}
+    bad_events = [
+        ticker
+        for ticker, event in first_events.items()
+        if not (("date" in event or "release_date" in event) and ("category" in event or "title" in event))
+    ]
+    bad_trades = [
+        ticker
+        for ticker, trade in first_trades.items()
+        if not (("transaction_date" in trade or "filing_date" in trade) and ("name" in trade or "insider_name" in trade))
+    ]
+    assert not bad_events, f"Malformed calendar events for {bad_events}"
+    assert not bad_trades, f"Malformed insider trades for {bad_trades}"
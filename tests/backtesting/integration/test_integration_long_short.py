@@ -124,9 +124,8 @@ def test_long_short_strategy_full_liquidation_to_cash():
     realized_gains = final_portfolio["realized_gains"]
 
     # All flat after liquidation
-    for t in tickers:
-        assert positions[t]["long"] == 0
-        assert positions[t]["short"] == 0
+    held = [(positions[t]["long"], positions[t]["short"]) for t in tickers]
+    assert held == [(0, 0)] * len(tickers), f"Expected flat positions, got {dict(zip(tickers, held))}"
 
     # Realized PnL on all tickers as they were exited
     assert realized_gains["TTWO"]["long"] != 0.0
@@ -51,8 +51,8 @@ def test_short_only_strategy_shorts_and_covers():
     assert positions["LUG"]["short"] == 30
     assert positions["FDEV"]["short"] == 0
     # No long positions in a short-only plan
-    for t in tickers:
-        assert positions[t]["long"] == 0
+    longs = [positions[t]["long"] for t in tickers]
+    assert longs == [0] * len(tickers), f"Expected no long positions, got {dict(zip(tickers, longs))}"
 
     # TTWO partial cover should realize non-zero gains/losses; LUG none; FDEV none
     assert realized_gains["TTWO"]["short"] != 0.0
@@ -131,8 +131,8 @@ def test_short_only_strategy_full_cover_cycle():
     assert positions["LUG"]["short"] == 0
     assert positions["FDEV"]["short"] == 0
     # No longs
-    for t in tickers:
-        assert positions[t]["long"] == 0
+    longs = [positions[t]["long"] for t in tickers]
+    assert longs == [0] * len(tickers), f"Expected no long positions, got {dict(zip(tickers, longs))}"
 
     # All tickers should have realized short-side PnL
     assert realized_gains["TTWO"]["short"] != 0.0
@@ -207,8 +207,8 @@ def test_short_only_strategy_multiple_short_cover_cycles():
     assert positions["TTWO"]["short"] == 0
     assert positions["LUG"]["short"] == 0
     assert positions["FDEV"]["short"] == 0
-    for t in tickers:
-        assert positions[t]["long"] == 0
+    longs = [positions[t]["long"] for t in tickers]
+    assert longs == [0] * len(tickers), f"Expected no long positions, got {dict(zip(tickers, longs))}"
 
     # Realized gains should be non-zero for cycled names
     assert realized_gains["TTWO"]["short"] != 0.0
@@ -296,8 +296,8 @@ def test_short_only_strategy_portfolio_rebalancing():
     assert positions["LUG"]["short"] == 40
     assert positions["FDEV"]["short"] == 30
     # No longs
-    for t in tickers:
-        assert positions[t]["long"] == 0
+    longs = [positions[t]["long"] for t in tickers]
+    assert longs == [0] * len(tickers), f"Expected no long positions, got {dict(zip(tickers, longs))}"
 
     # Realized gains only for TTWO (covered), none for LUG/FDEV (still open)
     assert realized_gains["TTWO"]["short"] != 0.0
@@ -377,8 +377,8 @@ def test_short_only_strategy_dollar_cost_averaging_on_short():
     assert positions["TTWO"]["short"] == 40
     assert positions["LUG"]["short"] == 0
     assert positions["FDEV"]["short"] == 0
-    for t in tickers:
-        assert positions[t]["long"] == 0
+    longs = [positions[t]["long"] for t in tickers]
+    assert longs == [0] * len(tickers), f"Expected no long positions, got {dict(zip(tickers, longs))}"
 
     # Weighted short_cost_basis should be positive (non-zero) while position remains
     assert positions["TTWO"]["short_cost_basis"] > 0.0
@@ -232,3 +232,24 @@ def test_cache_stats(temp_cache):
     assert stats["fresh_entries"] == 2
     assert stats["stale_entries"] == 1
     assert stats["unique_tickers"] == 3
+
+
+def test_precomputed_prompt_hash(temp_cache):
+    """Test that a caller-supplied prompt hash addresses the same entry."""
+    from src.data.llm_response_cache import hash_prompt
+
+    prompt = "Test prompt for NVDA"
+    prompt_hash = hash_prompt(prompt)
+    sample_response = SampleResponse(signal="neutral", confidence=50, reasoning="Mixed")
+
+    temp_cache.store_response(
+        ticker="NVDA",
+        analyst_name="warren_buffett",
+        prompt=prompt,
+        response=sample_response,
+        prompt_hash=prompt_hash,
+    )
+
+    cached = temp_cache.get_cached_response(ticker="NVDA", analyst_name="warren_buffett", prompt=prompt)
+    assert cached is not None
+    assert cached["signal"] == "neutral"
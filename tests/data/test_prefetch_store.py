@@ -147,3 +147,22 @@ def test_parallel_fetch_fills_and_uses_cache(monkeypatch, tmp_path):
     assert isinstance(cached["prices"][0], Price)
     assert isinstance(cached["metrics"][0], FinancialMetrics)
     assert cached["market_cap"] == pytest.approx(payload["market_cap"])
+
+
+def test_bulk_insider_failure_falls_back_to_per_ticker(monkeypatch):
+    import src.data.parallel_api_wrapper as wrapper
+
+    def failing_bulk(*args, **kwargs):
+        raise RuntimeError("bulk endpoint down")
+
+    def per_ticker(ticker, *args, **kwargs):
+        if ticker == "BAD":
+            raise RuntimeError("no instrument")
+        return [ticker]
+
+    monkeypatch.setattr(wrapper, "get_insider_trades_bulk", failing_bulk)
+    monkeypatch.setattr(wrapper, "get_insider_trades", per_ticker)
+
+    result = asyncio.run(wrapper.parallel_fetch_insider_trades(["AAA", "BAD", "CCC"], "2025-01-31"))
+
+    assert result == {"AAA": ["AAA"], "BAD": [], "CCC": ["CCC"]}
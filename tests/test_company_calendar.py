@@ -5,7 +5,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from src.tools.api import CompanyEvent, get_company_events
+from src.tools.api import CompanyEvent, _normalise_calendar_date, get_company_events
 
 
 def _make_iso(date_str: str) -> str:
@@ -106,3 +106,17 @@ def test_get_company_events_returns_cached_events(mock_get_client: Mock, mock_ca
 
     mock_get_client.assert_not_called()
     mock_cache.set_company_events.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("2024-03-08T00:00:00", "2024-03-08"),
+        ("2024-03-08", "2024-03-08"),
+        ("2023-02-30T00:00:00", None),
+        ("2024-13-01", None),
+        (None, None),
+    ],
+)
+def test_normalise_calendar_date_rejects_impossible_dates(raw, expected) -> None:
+    assert _normalise_calendar_date(raw) == expected
@@ -320,3 +320,16 @@ def test_governor_blocks_fresh_buys(monkeypatch):
     assert results["governor"] == halted
     assert results["recommendations"][0]["action"] == "HOLD"
     assert results["updated_portfolio"]["positions"] == []
+
+
+def test_analyst_pool_is_created_lazily_and_closed():
+    portfolio = Portfolio(positions=[], cash_holdings={"SEK": 0.0}, last_updated=datetime.utcnow())
+    manager = EnhancedPortfolioManager(portfolio=portfolio, universe=["AAA"], analysts=[], model_config={})
+
+    assert manager._executor is None
+    manager.close()
+
+    executor = manager._get_executor()
+    assert manager._get_executor() is executor
+    manager.close()
+    assert manager._executor is None
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from unittest.mock import Mock, patch
+
+from src.tools.api import Price, get_prices
+
+
+@patch("src.tools.api._cache")
+@patch("src.tools.api._get_borsdata_client")
+def test_get_prices_normalises_raw_bars(mock_get_client: Mock, mock_cache: Mock) -> None:
+    mock_cache.get_prices.return_value = None
+
+    stub_client = Mock()
+    stub_client.get_stock_prices_by_ticker.return_value = [
+        {"d": "2024-03-01", "o": 10.0, "c": 10.5, "h": 11.0, "l": 9.5, "v": 1200},
+        {"d": "2024-03-04T00:00:00Z", "c": 11.0, "v": None},
+        {"d": None, "c": 12.0},
+        {"d": "2024-03-05", "c": None},
+    ]
+    mock_get_client.return_value = stub_client
+
+    prices = get_prices("ABB", "2024-03-01", "2024-03-05")
+
+    assert prices == [
+        Price(open=10.0, close=10.5, high=11.0, low=9.5, volume=1200, time="2024-03-01T00:00:00Z"),
+        Price(open=11.0, close=11.0, high=11.0, low=11.0, volume=0, time="2024-03-04T00:00:00Z"),
+    ]
+    cache_key, payload = mock_cache.set_prices.call_args.args
+    assert cache_key == "ABB_2024-03-01_2024-03-05"
+    assert payload == [price.model_dump() for price in prices]
+
+
+def test_borsdata_client_cache_evicts_least_recently_used(monkeypatch) -> None:
+    import src.tools.api as api
+
+    monkeypatch.setattr(api, "_MAX_CACHED_CLIENTS", 2)
+    monkeypatch.setattr(api, "_borsdata_clients", api.OrderedDict())
+    monkeypatch.setattr(api, "_financial_metrics_assemblers", {})
+    monkeypatch.setattr(api, "_line_item_assemblers", {})
+    monkeypatch.setattr(api, "BorsdataClient", lambda api_key: Mock(name=api_key))
+
+    hot = api._get_borsdata_client("hot")
+    api._get_financial_metrics_assembler(api._get_borsdata_client("cold"), "cold")
+    assert api._get_borsdata_client("hot") is hot
+    api._get_borsdata_client("new")
+
+    assert list(api._borsdata_clients) == ["hot", "new"]
+    assert "cold" not in api._financial_metrics_assemblers
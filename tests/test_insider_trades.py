@@ -4,7 +4,8 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from src.tools.api import InsiderTrade, get_insider_trades
+from src.data.borsdata_client import BorsdataAPIError
+from src.tools.api import InsiderTrade, get_insider_trades, get_insider_trades_bulk
 
 
 @patch("src.tools.api._cache")
@@ -141,3 +142,64 @@ def test_get_insider_trades_uses_cache_when_available(mock_get_client: Mock, moc
 
     mock_get_client.assert_not_called()
     mock_cache.set_insider_trades.assert_not_called()
+
+
+@patch("src.tools.api._cache")
+@patch("src.tools.api._get_borsdata_client")
+def test_get_insider_trades_bulk_issues_one_holdings_request(mock_get_client: Mock, mock_cache: Mock) -> None:
+    mock_cache.get_insider_trades.return_value = None
+
+    instruments = {"AAA": {"insId": 1, "name": "AAA AB"}, "BBB": {"insId": 2, "name": "BBB AB"}}
+
+    def _get_instrument(ticker: str, **_: object) -> dict:
+        if ticker not in instruments:
+            raise BorsdataAPIError(f"Ticker '{ticker}' not found")
+        return instruments[ticker]
+
+    stub_client = Mock()
+    stub_client.get_instrument.side_effect = _get_instrument
+    stub_client.get_insider_holdings.return_value = [
+        {"insId": 1, "transactionDate": "2024-03-04T00:00:00", "verificationDate": "2024-03-05T00:00:00", "shares": "10", "transactionType": 0, "ownerName": "A"},
+        {"insId": 2, "transactionDate": "2024-03-06T00:00:00", "verificationDate": "2024-03-07T00:00:00", "shares": "20", "transactionType": 3, "ownerName": "B"},
+    ]
+    mock_get_client.return_value = stub_client
+
+    trades = get_insider_trades_bulk(["AAA", "BBB", "CCC"], end_date="2024-03-10", api_key="token")
+
+    assert [trade.name for trade in trades["AAA"]] == ["A"]
+    assert [trade.transaction_shares for trade in trades["BBB"]] == [-20.0]
+    assert trades["CCC"] == []
+    stub_client.get_insider_holdings.assert_called_once_with([1, 2], api_key="token")
+    assert mock_cache.set_insider_trades.call_count == 2
+    cache_key, payload = mock_cache.set_insider_trades.call_args.args
+    assert payload == [trade.model_dump() for trade in trades[cache_key.split("_")[0]]]
+
+
+@patch("src.tools.api._cache")
+@patch("src.tools.api._get_borsdata_client")
+def test_get_insider_trades_drops_impossible_dates(mock_get_client: Mock, mock_cache: Mock) -> None:
+    mock_cache.get_insider_trades.return_value = None
+
+    stub_client = Mock()
+    stub_client.get_instrument.return_value = {"insId": 7, "name": "Example AB"}
+    stub_client.get_insider_holdings.return_value = [
+        {
+            "transactionDate": "2023-02-30T00:00:00",
+            "verificationDate": "2023-02-31T00:00:00",
+            "shares": "100",
+            "transactionType": 1,
+            "ownerName": "Bad Date",
+        },
+        {
+            "transactionDate": "2023-02-27T00:00:00",
+            "verificationDate": "2023-02-28T00:00:00",
+            "shares": "50",
+            "transactionType": 1,
+            "ownerName": "Good Date",
+        },
+    ]
+    mock_get_client.return_value = stub_client
+
+    trades = get_insider_trades(ticker="EX", end_date="2023-03-31", start_date="2023-02-01", api_key="token")
+
+    assert [trade.name for trade in trades] == ["Good Date"]
@@ -0,0 +1,79 @@
+"""Tests for the rebalance console report."""
+
+from types import SimpleNamespace
+
+from src.utils.output_formatter import display_results, format_as_portfolio_csv, write_portfolio_csv
+
+
+def _results():
+    return {
+        "analysis_date": "2024-05-01",
+        "current_portfolio": {"home_currency": "SEK", "total_value": 1234567.5, "num_positions": 2, "exchange_rates": {"SEK": 1.0, "USD": 10.5}},
+        "recommendations": [
+            {"ticker": "AAA", "action": "SELL", "current_shares": 10, "target_shares": 0, "value_delta": -1000, "currency": "SEK", "current_price": 100.0, "reasoning": "Weak outlook"},
+            {"ticker": "BBB", "action": "ADD", "current_shares": 0, "target_shares": 88.7, "value_delta": 5000.4, "currency": "USD", "current_price": 4.48},
+        ],
+        "analyst_signals": [SimpleNamespace(ticker="AAA", analyst="buffett", signal=0.5)],
+    }
+
+
+def test_display_results_renders_table_and_summary(capsys):
+    display_results(_results(), verbose=False)
+    out = capsys.readouterr().out
+
+    assert "Current Portfolio Value: 1,234,567.50 SEK" in out
+    assert "   1 USD = 10.5000 SEK" in out
+    assert "| Sell all 10 @ 100.00 |" in out
+    assert "| Buy 88 @ 4.48        |" in out
+    assert "  🔴 1 position(s) to sell" in out
+    assert "  🟢 1 position(s) to add" in out
+    assert "ANALYST OPINIONS" not in out
+
+
+def test_display_results_verbose_sections(capsys):
+    display_results(_results(), verbose=True)
+    out = capsys.readouterr().out
+
+    assert "  • AAA: Sell all 10 @ 100.00 → -1,000 SEK\n    Reasoning: Weak outlook" in out
+    assert "\nAAA:\n  buffett: Bullish (+0.50)" in out
+    assert out.endswith("\n")
+
+
+def test_format_shares_truncates_numbers_and_passes_through_non_finite():
+    from src.utils.output_formatter import _format_shares
+
+    assert [_format_shares(v) for v in (None, 12, 88.7, -2.5, float("nan"))] == ["0", "12", "88", "-2", "nan"]
+
+
+def test_write_portfolio_csv_matches_dataframe_export(tmp_path) -> None:
+    results = {
+        "updated_portfolio": {
+            "positions": [
+                {"ticker": "TTWO", "shares": 10, "cost_basis": 150.456, "currency": "USD", "date_acquired": "2025-09-30"},
+                {"ticker": "ERIC B", "shares": 40, "cost_basis": 72.1, "currency": "SEK", "date_acquired": ""},
+                {"ticker": "SOLD", "shares": 0, "cost_basis": 1.0, "currency": "SEK", "date_acquired": ""},
+            ],
+            "cash": {"SEK": 1234.567, "USD": 0.0},
+        }
+    }
+    path = tmp_path / "portfolio.csv"
+
+    row_count = write_portfolio_csv(results, path)
+
+    assert row_count == 3
+    assert path.read_text() == format_as_portfolio_csv(results).to_csv(index=False)
+
+
+def test_write_portfolio_csv_keeps_whole_shares_without_cash(tmp_path) -> None:
+    results = {
+        "updated_portfolio": {
+            "positions": [{"ticker": "TTWO", "shares": 100, "cost_basis": 150.456, "currency": "USD", "date_acquired": "2025-09-30"}],
+            "cash": {},
+        }
+    }
+    path = tmp_path / "portfolio.csv"
+
+    write_portfolio_csv(results, path)
+
+    assert path.read_text() == "ticker,shares,cost_basis,currency,date_acquired\nTTWO,100,150.46,USD,2025-09-30\n"
+    assert path.read_text() == format_as_portfolio_csv(results).to_csv(index=False)
@@ -0,0 +1,72 @@
+"""Tests for portfolio CSV loading."""
+
+import warnings
+from datetime import datetime
+
+import pytest
+
+from src.utils.portfolio_loader import load_portfolio, load_universe
+
+
+def test_load_portfolio_splits_cash_and_applies_defaults(tmp_path):
+    csv_path = tmp_path / "portfolio.csv"
+    csv_path.write_text("ticker,shares,cost_basis,currency,date_acquired\n" " AAPL ,10,150.5,USD,2024-01-15\n" "ERIC B,100,,SEK,\n" "CASH,5000,,SEK,\n" "cash,100.5,,,\n" "XYZ,-3,1,FOO,\n")
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        portfolio = load_portfolio(str(csv_path))
+
+    assert [(p.ticker, p.shares, p.cost_basis, p.currency) for p in portfolio.positions] == [("AAPL", 10.0, 150.5, "USD"), ("ERIC B", 100.0, 0.0, "SEK"), ("XYZ", -3.0, 1.0, "FOO")]
+    assert portfolio.positions[0].date_acquired == datetime(2024, 1, 15)
+    assert portfolio.positions[1].date_acquired is None
+    assert portfolio.cash_holdings == {"SEK": 5000.0, "USD": 100.5}
+    assert [str(w.message) for w in caught] == [
+        "Row 6: Negative shares (-3.0) for XYZ - is this intentional (short position)?",
+        "Row 6: Unknown currency 'FOO' for XYZ - not in ISO 4217 list",
+    ]
+
+
+def test_load_portfolio_without_optional_columns(tmp_path):
+    csv_path = tmp_path / "portfolio.csv"
+    csv_path.write_text("ticker,shares\nAAPL,10\nCASH,50\n")
+
+    portfolio = load_portfolio(str(csv_path))
+
+    assert [(p.ticker, p.shares, p.cost_basis, p.currency, p.date_acquired) for p in portfolio.positions] == [("AAPL", 10.0, 0.0, "USD", None)]
+    assert portfolio.cash_holdings == {"USD": 50.0}
+
+
+def test_load_universe_parses_lines_csv_comments_and_delisted(tmp_path, capsys):
+    universe_path = tmp_path / "universe.txt"
+    universe_path.write_text("# header\n-- skip, this\n# DELISTED: OLD - merged\nAAPL, MSFT, \"ERIC B\"\n  'VOLV B'  # inline, not a ticker\n\"A, B\",AAPL\nNOVO B\n")
+
+    universe = load_universe(str(universe_path), tickers_str="TSLA, MSFT#x", verbose=True)
+
+    assert universe == ["AAPL", "MSFT", "ERIC B", "VOLV B", "A, B", "NOVO B", "TSLA"]
+    assert "Skipping 1 delisted ticker(s): OLD" in capsys.readouterr().out
+
+
+def test_load_portfolio_parses_non_iso_acquisition_dates(tmp_path):
+    csv_path = tmp_path / "portfolio.csv"
+    csv_path.write_text("ticker,shares,date_acquired\nAAA,1,2024/01/15\nBBB,1,01/02/2024\nCCC,1,15.01.2024\nDDD,1,01.02.2024\nEEE,1,15/01/2024\n")
+
+    portfolio = load_portfolio(str(csv_path))
+
+    # Ambiguous dates are month-first, as pd.to_datetime read them; day-first only when the month is invalid
+    assert [p.date_acquired for p in portfolio.positions] == [
+        datetime(2024, 1, 15),
+        datetime(2024, 1, 2),
+        datetime(2024, 1, 15),
+        datetime(2024, 1, 2),
+        datetime(2024, 1, 15),
+    ]
+
+
+@pytest.mark.parametrize("raw", ["2024-1-5", "2024.01.05", "Jan 5, 2024", "5 Jan 2024"])
+def test_load_portfolio_falls_back_to_pandas_for_other_dates(tmp_path, raw):
+    csv_path = tmp_path / "portfolio.csv"
+    csv_path.write_text(f'ticker,shares,date_acquired\nAAA,1,"{raw}"\n')
+
+    portfolio = load_portfolio(str(csv_path))
+
+    assert portfolio.positions[0].date_acquired == datetime(2024, 1, 5)